@@ -1,43 +1,47 @@
 """Simple healthcheck script for local/cron monitoring."""
 
+import argparse
 import sys
-from datetime import datetime
+from datetime import UTC, datetime
 
-from feed.config import get_settings
-from feed.storage.db import Database
 
-
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Run healthcheck and return exit code."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Also verify LLM and Resend credentials with cheap read-only API calls",
+    )
+    args = parser.parse_args(argv)
+
+    from feed.config import get_settings, validate_settings
+    from feed.storage.db import Database
+
     settings = get_settings()
 
-    issues: list[str] = []
+    issues = validate_settings(settings)
 
     db_path = settings.data_dir / "articles.db"
     if not db_path.exists():
         issues.append("Database not found")
     else:
-        db = Database(db_path)
-        with db._connection() as conn:
-            last_article = conn.execute(
-                """
-                SELECT MAX(created_at) FROM articles
-                """
-            ).fetchone()[0]
-
-            if last_article:
-                last_time = datetime.fromisoformat(last_article)
-                age_hours = (datetime.now() - last_time).total_seconds() / 3600
-                if age_hours > 48:
-                    issues.append(f"No new articles in {age_hours:.0f} hours")
-            else:
-                issues.append("No articles in database")
-
-    if not settings.llm_api_key:
-        issues.append("Missing LLM API key")
-
-    if not settings.resend_api_key:
-        issues.append("Missing Resend API key")
+        db = Database.shared(db_path)
+        last_article = db.max_article_ts()
+
+        if last_article:
+            age_hours = (datetime.now(UTC) - last_article).total_seconds() / 3600
+            if age_hours > 48:
+                issues.append(f"No new articles in {age_hours:.0f} hours")
+        else:
+            issues.append("No articles in database")
+
+    # Only probe upstream once the keys at least look right.
+    if args.deep and not issues:
+        from feed.health import run_deep_checks
+        from feed.storage.cache import CacheStore
+
+        issues.extend(run_deep_checks(settings, cache=CacheStore(db_path)))
 
     if issues:
         print("UNHEALTHY")
@@ -14,8 +14,8 @@ from feed.logging_config import setup_logging
 from feed.models import Article, CategoryDigest, DailyDigest
 
 
-def create_sample_digest() -> DailyDigest:
-    """Create a sample digest for testing."""
+def _build_sample_digest() -> DailyDigest:
+    """Build (and validate) the sample digest. Called once at import."""
     articles = [
         Article(
             id="1",
@@ -106,6 +106,14 @@ def create_sample_digest() -> DailyDigest:
     )
 
 
+_SAMPLE_DIGEST = _build_sample_digest()
+
+
+def create_sample_digest() -> DailyDigest:
+    """Return a fresh copy of the sample digest without re-running validation."""
+    return _SAMPLE_DIGEST.model_copy(deep=True, update={"date": datetime.now(UTC)})
+
+
 def main() -> None:
     """Test email delivery."""
     setup_logging("INFO")
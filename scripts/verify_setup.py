@@ -3,6 +3,7 @@
 import importlib
 import sys
 from pathlib import Path
+from typing import NoReturn
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -31,6 +32,16 @@ def _check_provider_sdk(provider: str, errors: list[str]) -> None:
     _check_import(module_name, errors)
 
 
+def _fail(errors: list[str]) -> NoReturn:
+    """Print the failure summary and exit non-zero."""
+    print("\n" + "=" * 50)
+    print("❌ Setup verification FAILED")
+    print("\nErrors:")
+    for error in errors:
+        print(f"  • {error}")
+    sys.exit(1)
+
+
 def main() -> None:
     """Run setup verification."""
     print("🔍 Verifying project setup...\n")
@@ -40,49 +51,46 @@ def main() -> None:
     print(f"Python version: {sys.version}")
     print("✅ Python version OK")
 
+    # Cheap checks first: no point importing SDKs if the config is broken.
+    print("\nRunning pre-flight checks...")
+    try:
+        from feed.config import get_settings, validate_settings
+
+        settings = get_settings()
+    except Exception as exc:
+        _fail([f"Configuration: {exc}"])
+    issues = validate_settings(settings)
+    if issues:
+        _fail(issues)
+    print("✅ Config files and API keys look valid")
+
     print("\nChecking dependencies...")
     _check_import("feedparser", errors)
     _check_import("resend", errors)
-    _check_import("bs4", errors, label="beautifulsoup4")
+    _check_import("lxml", errors)
     _check_import("yaml", errors, label="pyyaml")
     _check_import("pydantic", errors)
 
     print("\nChecking configuration...")
-    try:
-        from config import get_settings
+    print(f"   LLM provider: {settings.llm_provider}")
+    print(f"   LLM model: {settings.llm_model}")
+    print(f"   Email from: {settings.email_from}")
+    _check_provider_sdk(settings.llm_provider, errors)
 
-        settings = get_settings()
-        print("✅ Settings loaded")
-        print(f"   LLM provider: {settings.llm_provider}")
-        print(f"   LLM model: {settings.llm_model}")
-        print(f"   Email from: {settings.email_from}")
+    print("\nChecking feeds config...")
+    try:
+        from feed.config import FeedConfig
 
-        _check_provider_sdk(settings.llm_provider, errors)
+        feed_config = FeedConfig(settings.config_dir / "feeds.yaml")
+        urls = feed_config.get_feed_urls()
+        print(f"✅ Found {len(urls)} configured feeds")
     except Exception as exc:
-        errors.append(f"Configuration: {exc}")
+        errors.append(f"Feeds config: {exc}")
 
-    print("\nChecking feeds config...")
-    feeds_path = Path("config/feeds.yaml")
-    if feeds_path.exists():
-        try:
-            from config import FeedConfig
-
-            feed_config = FeedConfig(feeds_path)
-            urls = feed_config.get_feed_urls()
-            print(f"✅ Found {len(urls)} configured feeds")
-        except Exception as exc:
-            errors.append(f"Feeds config: {exc}")
-    else:
-        errors.append("config/feeds.yaml not found")
-
-    print("\n" + "=" * 50)
     if errors:
-        print("❌ Setup verification FAILED")
-        print("\nErrors:")
-        for error in errors:
-            print(f"  • {error}")
-        sys.exit(1)
+        _fail(errors)
 
+    print("\n" + "=" * 50)
     print("✅ Setup verification PASSED")
     print("\nReady to proceed to Phase 1!")
 
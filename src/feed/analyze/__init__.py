@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import logging
 from datetime import UTC, datetime, timedelta
+from itertools import batched
 from typing import TYPE_CHECKING, NamedTuple
 
-from feed.config import get_settings
-from feed.llm import create_client
+from feed.config import get_settings, validate_settings
+from feed.llm import get_client
 from feed.logging_config import get_logger
 from feed.models import Article, ArticleStatus, DailyDigest
 from feed.storage.db import Database
@@ -49,7 +51,11 @@ def run_analysis(
 
     from feed import pricing
 
-    start_time = time.time()
+    # Monotonic, integer clock: immune to wall-clock jumps mid-run.
+    start_ns = time.perf_counter_ns()
+
+    def elapsed() -> float:
+        return (time.perf_counter_ns() - start_ns) / 1e9
 
     settings = get_settings()
     lookback_hours = lookback_hours or settings.lookback_hours
@@ -57,6 +63,21 @@ def run_analysis(
     api_key = settings.llm_api_key
     model = settings.llm_model
 
+    # Fail fast on obvious misconfiguration before touching the DB or the API.
+    issues = validate_settings(settings, feeds=False, email=False)
+    if issues:
+        for issue in issues:
+            logger.error(issue)
+        return AnalysisResult(
+            digest=None,
+            articles_analyzed=0,
+            input_tokens=0,
+            output_tokens=0,
+            cost_estimate_usd=0.0,
+            duration_seconds=elapsed(),
+            errors=issues,
+        )
+
     errors: list[str] = []
     total_in = 0
     total_out = 0
@@ -73,11 +94,17 @@ def run_analysis(
             db_path=db.db_path,
             default_ttl_days=settings.cache_ttl_days,
         )
+        try:
+            purged = cache.purge_expired()
+            if purged:
+                logger.debug(f"Purged {purged} expired cache entries")
+        except Exception as exc:
+            logger.warning(f"Cache purge failed: {exc}")
 
     since = datetime.now(UTC) - timedelta(hours=lookback_hours)
-    articles = db.get_articles_since(since, status=ArticleStatus.PENDING)
+    total = db.count_articles_since(since, status=ArticleStatus.PENDING)
 
-    if not articles:
+    if not total:
         logger.info("No pending articles to analyze")
         return AnalysisResult(
             digest=None,
@@ -85,17 +112,18 @@ def run_analysis(
             input_tokens=0,
             output_tokens=0,
             cost_estimate_usd=0.0,
-            duration_seconds=time.time() - start_time,
+            duration_seconds=elapsed(),
             errors=[],
         )
 
-    logger.info(f"Analyzing {len(articles)} articles")
+    logger.info(f"Analyzing {total} articles")
 
-    llm_client = create_client(
+    llm_client = get_client(
         provider=provider,
         api_key=api_key,
         model=model,
         max_retries=settings.llm_retries,
+        timeout=settings.llm_timeout,
     )
     summarizer = Summarizer(client=llm_client)
     digest_builder = DigestBuilder(
@@ -103,41 +131,69 @@ def run_analysis(
         insights_mode=settings.insights_mode,
         insight_min_confidence=settings.insight_min_confidence,
         max_insights_per_digest=settings.max_insights_per_digest,
+        max_concurrency=settings.llm_concurrency,
+        use_batch_api=settings.llm_batch_api,
+        batch_poll_seconds=settings.llm_batch_poll_seconds,
+        batch_max_wait_seconds=settings.llm_batch_max_wait_minutes * 60,
+        cache=cache,
+        model_name=model,
     )
 
     summarized_articles: list[Article] = []
 
-    def on_progress(i: int, total: int, article: Article) -> None:
-        logger.info(f"[{i + 1}/{total}] {article.title[:40]}...")
-
-    summary_results = summarizer.summarize_batch(
-        articles,
-        on_progress=on_progress,
+    # Throttle progress lines: cache hits can complete thousands per second.
+    log_every = max(1, total // 20)
+    last_log = 0.0
+
+    def on_progress(position: int, article: Article) -> None:
+        nonlocal last_log
+        now = time.monotonic()
+        if position not in (1, total) and position % log_every and now - last_log < 1.0:
+            return
+        last_log = now
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"[{position}/{total}] {article.title[:40]}...")
+
+    # Stream pending articles through one summarizer pool, which pulls the next
+    # request's articles as each one finishes, so only the in-flight bodies are
+    # held in memory. Results are stored as they arrive, one commit per
+    # concurrency window's worth instead of one per article.
+    commit_size = settings.llm_concurrency * settings.llm_batch_size
+    summaries = summarizer.iter_summaries(
+        db.iter_articles_since(since, status=ArticleStatus.PENDING),
         cache=cache,
         model_name=model,
+        max_concurrency=settings.llm_concurrency,
+        batch_size=settings.llm_batch_size,
     )
-
-    for article, result in zip(articles, summary_results, strict=False):
-        total_in += result["input_tokens"]
-        total_out += result["output_tokens"]
-
-        if result["success"]:
-            article.summary = result["summary"]
-            article.key_takeaways = result["key_takeaways"]
-            article.action_items = result["action_items"]
-            article.status = ArticleStatus.SUMMARIZED
-
-            db.update_article_summary(
-                article_id=article.id,
-                summary=result["summary"] or "",
-                key_takeaways=result["key_takeaways"],
-                action_items=result["action_items"],
-            )
-
-            summarized_articles.append(article)
-        else:
-            db.update_article_status(article.id, ArticleStatus.FAILED)
-            errors.append(f"Failed to summarize: {article.title[:30]} - {result['error']}")
+    position = 0
+    for window in batched(summaries, commit_size):
+        with db.transaction():
+            for _, article, result in window:
+                position += 1
+                on_progress(position, article)
+                total_in += result["input_tokens"]
+                total_out += result["output_tokens"]
+
+                if result["success"]:
+                    article.summary = result["summary"]
+                    article.key_takeaways = result["key_takeaways"]
+                    article.action_items = result["action_items"]
+                    article.status = ArticleStatus.SUMMARIZED
+                    # The digest only needs summaries; drop the body once summarized.
+                    article.content = ""
+
+                    db.update_article_summary(
+                        article_id=article.id,
+                        summary=result["summary"] or "",
+                        key_takeaways=result["key_takeaways"],
+                        action_items=result["action_items"],
+                    )
+
+                    summarized_articles.append(article)
+                else:
+                    db.update_article_status(article.id, ArticleStatus.FAILED)
+                    errors.append(f"Failed to summarize: {article.title[:30]} - {result['error']}")
 
     if not summarized_articles:
         logger.warning("No articles were successfully summarized")
@@ -147,7 +203,7 @@ def run_analysis(
             input_tokens=total_in,
             output_tokens=total_out,
             cost_estimate_usd=pricing.estimate_cost(model, total_in, total_out),
-            duration_seconds=time.time() - start_time,
+            duration_seconds=elapsed(),
             errors=errors,
         )
 
@@ -157,7 +213,7 @@ def run_analysis(
     total_in += digest_in
     total_out += digest_out
 
-    duration = time.time() - start_time
+    duration = elapsed()
     digest.processing_time_seconds = duration
 
     logger.info(
@@ -1,27 +1,44 @@
 """Builds the daily digest by synthesizing summarized articles."""
 
 import re
-from collections import defaultdict
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Literal
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
 from feed.config import get_settings
-from feed.llm import LLMClient, create_client
+from feed.llm import BatchRequest, LLMClient, LLMError, LLMResponse, get_client
 from feed.logging_config import get_logger
 from feed.models import Article, CategoryDigest, DailyDigest, NonObviousInsight
+from feed.storage.cache import CacheStore, make_cache_key
 
 from .prompts import (
     CATEGORY_SYNTHESIS_USER,
     DIGEST_SYNTHESIS_SYSTEM,
+    MULTI_CATEGORY_ITEM,
+    MULTI_CATEGORY_SYNTHESIS_USER,
     OVERALL_SYNTHESIS_SYSTEM,
     OVERALL_SYNTHESIS_USER,
 )
 
 logger = get_logger("digest_builder")
 
+# Runs this small within one category skip the overall synthesis call: the
+# category synthesis already covers everything the overall pass would see.
+_SMALL_RUN_MAX_ARTICLES = 2
+
+# Per-item blocks of the synthesis prompts' summary sections.
+_ARTICLE_SUMMARY_TEMPLATE = (
+    "**{title}** ({feed_name})\nURL: {url}\nSummary: {summary}\nKey points: {key_points}"
+)
+_CATEGORY_SUMMARY_TEMPLATE = (
+    "**{name}** ({article_count} articles)\nSynthesis: {synthesis}\nKey takeaways: {key_takeaways}"
+)
+
 
 class InsightResponse(BaseModel):
     """Structured response for a non-obvious insight."""
@@ -49,6 +66,20 @@ class CategorySynthesisResponse(BaseModel):
     )
 
 
+class NamedCategorySynthesisResponse(CategorySynthesisResponse):
+    """Category synthesis tagged with its category, for grouped requests."""
+
+    name: str = Field(..., description="Category name exactly as given")
+
+
+class MultiCategorySynthesisResponse(BaseModel):
+    """Structured response for several small categories synthesized at once."""
+
+    categories: list[NamedCategorySynthesisResponse] = Field(
+        default_factory=list, description="One synthesis per category"
+    )
+
+
 class OverallSynthesisResponse(BaseModel):
     """Structured response for overall digest synthesis."""
 
@@ -74,19 +105,34 @@ class DigestBuilder:
         insights_mode: Literal["off", "auto", "always"] = "auto",
         insight_min_confidence: int = 4,
         max_insights_per_digest: int = 2,
+        max_concurrency: int = 4,
+        small_category_max_articles: int = 4,
+        use_batch_api: bool = False,
+        batch_poll_seconds: float = 60.0,
+        batch_max_wait_seconds: float = 3600.0,
+        cache: CacheStore | None = None,
+        model_name: str | None = None,
     ):
         if client is None:
             settings = get_settings()
-            client = create_client(
+            client = get_client(
                 provider=settings.llm_provider,
                 api_key=settings.llm_api_key,
                 model=settings.llm_model,
+                timeout=settings.llm_timeout,
             )
 
         self.client = client
         self.insights_mode = insights_mode
         self.insight_min_confidence = insight_min_confidence
         self.max_insights_per_digest = max_insights_per_digest
+        self.max_concurrency = max_concurrency
+        self.small_category_max_articles = small_category_max_articles
+        self.use_batch_api = use_batch_api
+        self.batch_poll_seconds = batch_poll_seconds
+        self.batch_max_wait_seconds = batch_max_wait_seconds
+        self.cache = cache
+        self.model_name = model_name
 
     def build_digest(self, articles: list[Article]) -> tuple[DailyDigest, int, int]:
         """Build a complete daily digest from articles.
@@ -98,25 +144,56 @@ class DigestBuilder:
         total_in = 0
         total_out = 0
 
-        by_category: dict[str, list[Article]] = defaultdict(list)
+        by_category: dict[str, list[Article]] = {}
         for article in articles:
-            by_category[article.category].append(article)
+            by_category.setdefault(article.category, []).append(article)
+
+        # Categories are independent, so their synthesis calls run concurrently;
+        # executor.map keeps results in sorted category order.
+        categories = sorted(by_category.items())
+        # Normalize each URL once; category gates use their slice, the overall
+        # pass uses the union.
+        category_urls = {
+            name: frozenset(self._normalize_url(str(a.url)) for a in category_articles)
+            for name, category_articles in categories
+        }
+        prefetched = self._run_category_batch(categories) if self.use_batch_api else {}
+        small = [
+            (name, category_articles)
+            for name, category_articles in categories
+            if name not in prefetched
+            and 1 < len(category_articles) <= self.small_category_max_articles
+        ]
+        if len(small) > 1:
+            prefetched.update(self._synthesize_small_categories(small))
+        workers = max(1, min(self.max_concurrency, len(categories)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            category_results = list(
+                executor.map(
+                    lambda item: self._build_category_digest(
+                        *item,
+                        allowed_urls=category_urls[item[0]],
+                        response=prefetched.get(item[0]),
+                    ),
+                    categories,
+                )
+            )
 
         category_digests: list[CategoryDigest] = []
-        for category_name, category_articles in sorted(by_category.items()):
-            logger.info(f"Processing category: {category_name} ({len(category_articles)} articles)")
-            category_digest, c_in, c_out = self._build_category_digest(
-                category_name, category_articles
-            )
+        for category_digest, c_in, c_out in category_results:
             category_digests.append(category_digest)
             total_in += c_in
             total_out += c_out
 
-        overall_themes, must_read, non_obvious_insights, o_in, o_out = self._synthesize_overall(
-            category_digests
-        )
-        total_in += o_in
-        total_out += o_out
+        if len(category_digests) == 1 and len(articles) <= _SMALL_RUN_MAX_ARTICLES:
+            logger.info("Single small category, skipping overall synthesis")
+            overall_themes, must_read, non_obvious_insights = [], [], []
+        else:
+            overall_themes, must_read, non_obvious_insights, o_in, o_out = self._synthesize_overall(
+                category_digests, frozenset().union(*category_urls.values())
+            )
+            total_in += o_in
+            total_out += o_out
 
         digest = DailyDigest(
             id=str(uuid4())[:8],
@@ -134,43 +211,198 @@ class DigestBuilder:
         )
         return digest, total_in, total_out
 
+    def _generate(
+        self,
+        prompt: str,
+        system: str,
+        response_schema: type[BaseModel],
+    ) -> LLMResponse:
+        """Call the LLM, memoized on (model, schema, system, prompt) when caching.
+
+        Cache hits cost nothing, so they report zero tokens. Only responses that
+        validate against the schema are stored.
+        """
+        if not (self.cache and self.model_name):
+            return self.client.generate(
+                prompt=prompt, system=system, response_schema=response_schema
+            )
+
+        cache_key = make_cache_key(self.model_name, response_schema.__name__, system, prompt)
+        try:
+            cached = self.cache.get("synthesis", cache_key)
+        except Exception as exc:
+            logger.warning(f"Cache read failed, falling through to LLM: {exc}")
+            cached = None
+        if cached is not None:
+            logger.debug(f"Synthesis cache hit ({response_schema.__name__})")
+            return LLMResponse(parsed=cached, raw_text="", input_tokens=0, output_tokens=0)
+
+        response = self.client.generate(
+            prompt=prompt, system=system, response_schema=response_schema
+        )
+        try:
+            response_schema.model_validate(response.parsed)
+            self.cache.set("synthesis", cache_key, response.parsed)
+        except Exception as exc:
+            logger.debug(f"Synthesis response not cached: {exc}")
+        return response
+
+    def _run_category_batch(
+        self, categories: list[tuple[str, list[Article]]]
+    ) -> dict[str, LLMResponse]:
+        """Run multi-article category syntheses as one provider batch job.
+
+        Returns responses keyed by category name. Categories missing from the
+        result (unsupported provider, failed item, timeout) fall back to a
+        live call in ``_build_category_digest``.
+        """
+        pending = [(name, articles) for name, articles in categories if len(articles) > 1]
+        if not pending:
+            return {}
+        if not getattr(self.client, "supports_batch", False):
+            logger.info("Provider has no batch API, using live synthesis calls")
+            return {}
+
+        # custom_ids are index-based: provider ID charsets exclude spaces etc.
+        requests = [
+            BatchRequest(
+                custom_id=f"cat-{index}",
+                prompt=self._category_prompt(name, articles),
+                system=DIGEST_SYNTHESIS_SYSTEM,
+                response_schema=CategorySynthesisResponse,
+            )
+            for index, (name, articles) in enumerate(pending)
+        ]
+        try:
+            batch_id = self.client.submit_batch(requests)  # type: ignore[attr-defined]
+        except LLMError as exc:
+            logger.warning(f"Synthesis batch submit failed, using live calls: {exc}")
+            return {}
+        logger.info(f"Submitted synthesis batch {batch_id} ({len(requests)} categories)")
+
+        deadline = time.monotonic() + self.batch_max_wait_seconds
+        try:
+            while (results := self.client.poll_batch(batch_id)) is None:  # type: ignore[attr-defined]
+                if time.monotonic() >= deadline:
+                    logger.warning(f"Synthesis batch {batch_id} timed out, using live calls")
+                    self._cancel_batch(batch_id)
+                    return {}
+                time.sleep(self.batch_poll_seconds)
+        except LLMError as exc:
+            logger.warning(f"Synthesis batch {batch_id} failed, using live calls: {exc}")
+            self._cancel_batch(batch_id)
+            return {}
+
+        return {
+            name: results[f"cat-{index}"]
+            for index, (name, _) in enumerate(pending)
+            if f"cat-{index}" in results
+        }
+
+    def _cancel_batch(self, batch_id: str) -> None:
+        """Best-effort cancel of an abandoned batch job, so it stops being billed."""
+        try:
+            self.client.cancel_batch(batch_id)  # type: ignore[attr-defined]
+        except LLMError as exc:
+            logger.warning(f"Could not cancel synthesis batch {batch_id}: {exc}")
+
+    def _synthesize_small_categories(
+        self, categories: list[tuple[str, list[Article]]]
+    ) -> dict[str, LLMResponse]:
+        """Synthesize several small categories with one LLM request.
+
+        Returns per-category responses (tokens split evenly) keyed by name, to
+        be gated by ``_build_category_digest`` like any other response.
+        Categories the model omits fall back to their own live call.
+        """
+        prompt = MULTI_CATEGORY_SYNTHESIS_USER.format(
+            count=len(categories),
+            categories="\n\n".join(
+                MULTI_CATEGORY_ITEM.format(
+                    category=name, article_summaries=self._article_summaries(articles)
+                )
+                for name, articles in categories
+            ),
+        )
+        logger.info(f"Synthesizing {len(categories)} small categories in one request")
+        try:
+            response = self._generate(
+                prompt=prompt,
+                system=DIGEST_SYNTHESIS_SYSTEM,
+                response_schema=MultiCategorySynthesisResponse,
+            )
+            parsed = MultiCategorySynthesisResponse.model_validate(response.parsed)
+        except Exception as exc:
+            logger.warning(f"Grouped category synthesis failed, using per-category calls: {exc}")
+            return {}
+
+        wanted = {name for name, _ in categories}
+        entries = {entry.name: entry for entry in parsed.categories if entry.name in wanted}
+        if not entries:
+            return {}
+
+        share_in, extra_in = divmod(response.input_tokens, len(entries))
+        share_out, extra_out = divmod(response.output_tokens, len(entries))
+        results: dict[str, LLMResponse] = {}
+        for position, (name, entry) in enumerate(entries.items()):
+            results[name] = LLMResponse(
+                parsed=entry.model_dump(exclude={"name"}),
+                raw_text=response.raw_text,
+                input_tokens=share_in + (extra_in if position == 0 else 0),
+                output_tokens=share_out + (extra_out if position == 0 else 0),
+            )
+        return results
+
+    @staticmethod
+    def _article_summaries(articles: list[Article]) -> str:
+        """Render article summaries for synthesis prompts."""
+        return "\n\n".join(
+            _ARTICLE_SUMMARY_TEMPLATE.format(
+                title=article.title,
+                feed_name=article.feed_name,
+                url=article.url,
+                summary=article.summary or "No summary available",
+                key_points=", ".join(article.key_takeaways) or "None",
+            )
+            for article in articles
+        )
+
+    @classmethod
+    def _category_prompt(cls, category_name: str, articles: list[Article]) -> str:
+        """Render the category synthesis prompt."""
+        return CATEGORY_SYNTHESIS_USER.format(
+            category=category_name,
+            article_summaries=cls._article_summaries(articles),
+        )
+
     def _build_category_digest(
         self,
         category_name: str,
         articles: list[Article],
+        allowed_urls: frozenset[str],
+        response: LLMResponse | None = None,
     ) -> tuple[CategoryDigest, int, int]:
         """Build digest for a single category.
 
-        Returns (digest, input_tokens, output_tokens).
+        ``response`` is a prefetched (batch) synthesis; without one, a live
+        call is made. Returns (digest, input_tokens, output_tokens).
         """
-        summaries_text = "\n\n".join(
-            [
-                f"**{article.title}** ({article.feed_name})\n"
-                f"URL: {article.url}\n"
-                f"Summary: {article.summary or 'No summary available'}\n"
-                "Key points: "
-                f"{', '.join(article.key_takeaways) if article.key_takeaways else 'None'}"
-                for article in articles
-            ]
-        )
+        logger.info(f"Processing category: {category_name} ({len(articles)} articles)")
 
         synthesis = ""
         top_takeaways: list[str] = []
         non_obvious_insight: NonObviousInsight | None = None
-        allowed_urls = {self._normalize_url(str(article.url)) for article in articles}
         in_tokens = 0
         out_tokens = 0
 
         if len(articles) > 1:
             try:
-                response = self.client.generate(
-                    prompt=CATEGORY_SYNTHESIS_USER.format(
-                        category=category_name,
-                        article_summaries=summaries_text,
-                    ),
-                    system=DIGEST_SYNTHESIS_SYSTEM,
-                    response_schema=CategorySynthesisResponse,
-                )
+                if response is None:
+                    response = self._generate(
+                        prompt=self._category_prompt(category_name, articles),
+                        system=DIGEST_SYNTHESIS_SYSTEM,
+                        response_schema=CategorySynthesisResponse,
+                    )
                 in_tokens = response.input_tokens
                 out_tokens = response.output_tokens
                 parsed = CategorySynthesisResponse.model_validate(response.parsed)
@@ -208,6 +440,7 @@ class DigestBuilder:
     def _synthesize_overall(
         self,
         category_digests: list[CategoryDigest],
+        allowed_urls: frozenset[str],
     ) -> tuple[list[str], list[str], list[NonObviousInsight], int, int]:
         """Generate overall themes across all categories.
 
@@ -217,22 +450,16 @@ class DigestBuilder:
             return [], [], [], 0, 0
 
         summaries_text = "\n\n".join(
-            [
-                f"**{digest.name}** ({digest.article_count} articles)\n"
-                f"Synthesis: {digest.synthesis}\n"
-                "Key takeaways: "
-                f"{', '.join(digest.top_takeaways) if digest.top_takeaways else 'None'}"
-                for digest in category_digests
-            ]
-        )
-        allowed_urls = {
-            self._normalize_url(str(article.url))
+            _CATEGORY_SUMMARY_TEMPLATE.format(
+                name=digest.name,
+                article_count=digest.article_count,
+                synthesis=digest.synthesis,
+                key_takeaways=", ".join(digest.top_takeaways) or "None",
+            )
             for digest in category_digests
-            for article in digest.articles
-        }
-
+        )
         try:
-            response = self.client.generate(
+            response = self._generate(
                 prompt=OVERALL_SYNTHESIS_USER.format(category_summaries=summaries_text),
                 system=OVERALL_SYNTHESIS_SYSTEM,
                 response_schema=OverallSynthesisResponse,
@@ -257,7 +484,7 @@ class DigestBuilder:
     def _approve_insight(
         self,
         insight: InsightResponse | None,
-        allowed_urls: set[str],
+        allowed_urls: frozenset[str],
         existing_texts: list[str],
     ) -> NonObviousInsight | None:
         """Apply confidence/source/duplication gates to a single insight."""
@@ -289,31 +516,33 @@ class DigestBuilder:
     def _approve_insights(
         self,
         insights: list[InsightResponse],
-        allowed_urls: set[str],
+        allowed_urls: frozenset[str],
         existing_texts: list[str],
         max_count: int,
     ) -> list[NonObviousInsight]:
         """Apply gating and cap logic to multiple insight candidates."""
         approved: list[NonObviousInsight] = []
+        # Grows with each approval instead of being rebuilt per candidate.
+        context = list(existing_texts)
 
         for candidate in insights:
-            current_context = [item.insight for item in approved]
             filtered = self._approve_insight(
                 insight=candidate,
                 allowed_urls=allowed_urls,
-                existing_texts=existing_texts + current_context,
+                existing_texts=context,
             )
             if filtered is None:
                 continue
 
             approved.append(filtered)
+            context.append(filtered.insight)
             if len(approved) >= max_count:
                 break
 
         return approved
 
     @staticmethod
-    def _filter_urls(urls: list[str], allowed_urls: set[str]) -> list[str]:
+    def _filter_urls(urls: list[str], allowed_urls: frozenset[str]) -> list[str]:
         """Keep unique URLs that are present in the provided source set."""
         filtered: list[str] = []
         seen: set[str] = set()
@@ -327,33 +556,36 @@ class DigestBuilder:
         return filtered
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalize_url(url: str) -> str:
-        """Normalize URL for deterministic membership checks."""
+        """Normalize URL for deterministic membership checks.
+
+        Memoized: the same source URLs recur across categories, the overall
+        pass, and every insight's supporting_urls.
+        """
         return url.strip().rstrip("/")
 
     @staticmethod
     def _is_near_duplicate(candidate: str, existing_texts: list[str]) -> bool:
         """Treat highly overlapping statements as duplicates."""
-        normalized = DigestBuilder._normalize_text(candidate)
-        if not normalized:
-            return True
-
-        candidate_tokens = set(re.findall(r"[a-z0-9]+", normalized))
-        if not candidate_tokens:
+        normalized, candidate_tokens = _fingerprint(candidate)
+        if not normalized or not candidate_tokens:
             return True
 
         for text in existing_texts:
-            existing_normalized = DigestBuilder._normalize_text(text)
+            existing_normalized, existing_tokens = _fingerprint(text)
             if not existing_normalized:
                 continue
 
             if normalized == existing_normalized:
                 return True
 
-            existing_tokens = set(re.findall(r"[a-z0-9]+", existing_normalized))
             if not existing_tokens:
                 continue
 
+            # Dividing by the smaller set means containment counts: a short
+            # restatement of a longer text is a duplicate however different
+            # their lengths, so no length-based prefilter is sound here.
             overlap = len(candidate_tokens & existing_tokens) / min(
                 len(candidate_tokens), len(existing_tokens)
             )
@@ -366,3 +598,17 @@ class DigestBuilder:
     def _normalize_text(text: str) -> str:
         """Normalize prose snippets for duplication checks."""
         return " ".join(text.lower().split())
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+@lru_cache(maxsize=1024)
+def _fingerprint(text: str) -> tuple[str, frozenset[str]]:
+    """Normalized text and its token set, memoized across duplicate checks.
+
+    ``_approve_insights`` re-checks every earlier text for each candidate, so
+    caching avoids re-normalizing and re-tokenizing the same strings.
+    """
+    normalized = DigestBuilder._normalize_text(text)
+    return normalized, frozenset(_TOKEN_RE.findall(normalized))
@@ -86,6 +86,36 @@ Create a synthesis for this category. Respond with JSON:
 Only include non_obvious_insight when there is a genuinely non-obvious
 conclusion. supporting_urls must come from the provided article URLs."""
 
+MULTI_CATEGORY_ITEM = """<category name="{category}">
+{article_summaries}
+</category>"""
+
+MULTI_CATEGORY_SYNTHESIS_USER = """Here are the summaries from today's articles,
+grouped into {count} categories:
+
+{categories}
+
+Create a separate synthesis for each category, treating each independently.
+Respond with JSON containing exactly one entry per category:
+{{
+    "categories": [
+        {{
+            "name": "category name exactly as given",
+            "synthesis": "2-4 sentences summarizing key themes across the category's articles",
+            "top_takeaways": ["most important insight 1", "most important insight 2"],
+            "non_obvious_insight": {{
+                "insight": "one-sentence finding that is not obvious at first glance",
+                "why_unintuitive": "one sentence explaining why this conclusion is unintuitive",
+                "confidence": 1-5,
+                "supporting_urls": ["url1"]
+            }} or null
+        }}
+    ]
+}}
+
+Only include non_obvious_insight when there is a genuinely non-obvious
+conclusion. supporting_urls must come from that category's article URLs."""
+
 OVERALL_SYNTHESIS_SYSTEM = """You are creating the executive summary for a
 daily newsletter digest. You need to identify the most important themes
 across all categories and give the reader a quick understanding of what
@@ -116,3 +146,36 @@ Be highly selective:
 - Only 1-3 must_read_overall URLs across everything
 - Up to 2 cross_category_insights
 - supporting_urls must come from the provided URLs"""
+
+ARTICLE_BATCH_ITEM = """<article index="{index}">
+Title: {title}
+Author: {author}
+Source: {feed_name}
+Published: {published}
+
+Content:
+{content}
+</article>"""
+
+ARTICLE_BATCH_SUMMARY_USER = """Summarize each of the following {count} articles
+and extract key insights. Treat every article independently.
+
+{articles}
+
+Respond with JSON in this exact format, with exactly {count} entries in
+"summaries", in the same order as the articles above, each carrying its
+article's index:
+{{
+    "summaries": [
+        {{
+            "index": 1,
+            "summary": "2-3 sentence summary capturing the main point and why it matters",
+            "key_takeaways": ["insight 1", "insight 2", "insight 3"],
+            "action_items": ["actionable item if any"]
+        }}
+    ]
+}}
+
+Focus on what's genuinely useful. Include up to 5 key_takeaways and up to
+3 action_items per article. If there are no clear action items, return an
+empty array."""
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import batched
 from typing import TYPE_CHECKING, TypedDict
 
 if TYPE_CHECKING:
@@ -12,11 +13,16 @@ if TYPE_CHECKING:
 from pydantic import BaseModel, Field
 
 from feed.config import get_settings
-from feed.llm import LLMClient, create_client
+from feed.llm import LLMClient, get_client
 from feed.logging_config import get_logger
 from feed.models import Article
 
-from .prompts import ARTICLE_SUMMARY_SYSTEM, ARTICLE_SUMMARY_USER
+from .prompts import (
+    ARTICLE_BATCH_ITEM,
+    ARTICLE_BATCH_SUMMARY_USER,
+    ARTICLE_SUMMARY_SYSTEM,
+    ARTICLE_SUMMARY_USER,
+)
 
 logger = get_logger("summarizer")
 
@@ -29,6 +35,20 @@ class ArticleSummaryResponse(BaseModel):
     action_items: list[str] = Field(description="Up to 3 actionable items")
 
 
+class BatchedArticleSummary(ArticleSummaryResponse):
+    """One entry of a multi-article response, tagged with its article's index."""
+
+    index: int | None = Field(default=None, description="The article's index attribute")
+
+
+class ArticleBatchSummaryResponse(BaseModel):
+    """Structured response schema for a multi-article summary request."""
+
+    summaries: list[BatchedArticleSummary] = Field(
+        ..., description="One summary per article, in input order"
+    )
+
+
 class SummaryResult(TypedDict):
     """Result of summarizing an article."""
 
@@ -42,16 +62,53 @@ class SummaryResult(TypedDict):
     error: str | None
 
 
+def _prompt_fields(article: Article) -> dict[str, str]:
+    """Template fields shared by single and batched summary prompts."""
+    content = article.content
+    if len(content) > 30000:
+        content = content[:30000] + "\n\n[Content truncated...]"
+
+    return {
+        "title": article.title,
+        "author": article.author,
+        "feed_name": article.feed_name,
+        "published": article.published.strftime("%Y-%m-%d"),
+        "content": content,
+    }
+
+
+def build_summary_prompt(article: Article) -> str:
+    """Render the user prompt for summarizing an article."""
+    return ARTICLE_SUMMARY_USER.format(**_prompt_fields(article))
+
+
+def build_batch_summary_prompt(articles: list[Article]) -> str:
+    """Render one user prompt that summarizes several articles at once."""
+    items = "\n\n".join(
+        ARTICLE_BATCH_ITEM.format(index=index, **_prompt_fields(article))
+        for index, article in enumerate(articles, start=1)
+    )
+    return ARTICLE_BATCH_SUMMARY_USER.format(count=len(articles), articles=items)
+
+
+def summary_cache_key(model_name: str, user_prompt: str) -> str:
+    """Content-addressed cache key for a summary request."""
+    from feed.storage.cache import make_cache_key
+
+    return make_cache_key(model_name, ARTICLE_SUMMARY_SYSTEM, user_prompt)
+
+
 class Summarizer:
     """Handles article summarization with an LLM provider client."""
 
     def __init__(self, client: LLMClient | None = None):
         if client is None:
             settings = get_settings()
-            client = create_client(
+            client = get_client(
                 provider=settings.llm_provider,
                 api_key=settings.llm_api_key,
                 model=settings.llm_model,
+                timeout=settings.llm_timeout,
             )
 
         self.client = client
@@ -63,35 +120,15 @@ class Summarizer:
         model_name: str | None = None,
     ) -> SummaryResult:
         """Generate a summary for a single article."""
-        # Check cache first
-        if cache and model_name:
-            from feed.storage.cache import make_cache_key
+        user_prompt = build_summary_prompt(article)
 
-            cache_key = make_cache_key(article.id, model_name)
-            try:
-                cached = cache.get("summary", cache_key)
-                if cached is not None:
-                    logger.info(f"Cache hit: {article.title[:50]}...")
-                    return SummaryResult(**cached)
-            except Exception as exc:
-                logger.warning(f"Cache read failed, falling through to LLM: {exc}")
-                cache_key = None
-        else:
-            cache_key = None
-
-        logger.info(f"Summarizing: {article.title[:50]}...")
+        # Check cache first. Keys are content-addressed, so identical prompts
+        # reuse a summary even across article IDs or re-ingests.
+        cached, cache_key = _cache_lookup(cache, model_name, article, user_prompt)
+        if cached is not None:
+            return cached
 
-        content = article.content
-        if len(content) > 30000:
-            content = content[:30000] + "\n\n[Content truncated...]"
-
-        user_prompt = ARTICLE_SUMMARY_USER.format(
-            title=article.title,
-            author=article.author,
-            feed_name=article.feed_name,
-            published=article.published.strftime("%Y-%m-%d"),
-            content=content,
-        )
+        logger.debug(f"Summarizing: {article.title[:50]}...")
 
         try:
             response = self.client.generate(
@@ -113,29 +150,83 @@ class Summarizer:
                 output_tokens=response.output_tokens,
                 error=None,
             )
-
-            # Store in cache on success — isolated so a cache
-            # write failure never drops a valid summary.
-            if cache and cache_key:
-                try:
-                    cache.set("summary", cache_key, dict(result))
-                except Exception as cache_exc:
-                    logger.warning(f"Cache write failed: {cache_exc}")
-
+            _cache_store(cache, cache_key, result)
             return result
 
         except Exception as exc:
             logger.error(f"Summarization error: {exc}")
-            return SummaryResult(
-                success=False,
-                article_id=article.id,
-                summary=None,
-                key_takeaways=[],
-                action_items=[],
-                input_tokens=0,
-                output_tokens=0,
-                error=str(exc),
+            return _failed_result(article, str(exc))
+
+    def summarize_group(
+        self,
+        articles: list[Article],
+        cache: CacheStore | None = None,
+        model_name: str | None = None,
+    ) -> list[SummaryResult]:
+        """Summarize several articles with a single LLM request.
+
+        Cached articles are skipped. If the batched response is malformed or
+        the request fails, the uncached articles fall back to one call each.
+        """
+        if len(articles) == 1:
+            return [self.summarize_article(articles[0], cache, model_name)]
+
+        results: list[SummaryResult | None] = [None] * len(articles)
+        pending: list[tuple[int, Article, str | None]] = []
+        for index, article in enumerate(articles):
+            cached, cache_key = _cache_lookup(
+                cache, model_name, article, build_summary_prompt(article)
             )
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append((index, article, cache_key))
+
+        if len(pending) == 1:
+            index, article, _ = pending[0]
+            results[index] = self.summarize_article(article, cache, model_name)
+        elif pending:
+            pending_articles = [article for _, article, _ in pending]
+            logger.debug(f"Summarizing {len(pending_articles)} articles in one request...")
+            try:
+                response = self.client.generate(
+                    prompt=build_batch_summary_prompt(pending_articles),
+                    system=ARTICLE_SUMMARY_SYSTEM,
+                    response_schema=ArticleBatchSummaryResponse,
+                )
+                parsed = ArticleBatchSummaryResponse.model_validate(response.parsed)
+                summaries = _align_summaries(parsed.summaries, len(pending))
+            except Exception as exc:
+                logger.warning(f"Batched summarization failed, falling back per article: {exc}")
+                for index, article, _ in pending:
+                    results[index] = self.summarize_article(article, cache, model_name)
+            else:
+                # Only articles the response skipped are re-requested, one call each
+                answered = sum(summary is not None for summary in summaries)
+                in_shares = iter(_split_tokens(response.input_tokens, answered))
+                out_shares = iter(_split_tokens(response.output_tokens, answered))
+                for (index, article, cache_key), summary in zip(pending, summaries, strict=True):
+                    if summary is None:
+                        logger.warning(f"Batched response skipped {article.title[:50]}, retrying")
+                        results[index] = self.summarize_article(article, cache, model_name)
+                        continue
+                    result = SummaryResult(
+                        success=True,
+                        article_id=article.id,
+                        summary=summary.summary,
+                        key_takeaways=summary.key_takeaways,
+                        action_items=summary.action_items,
+                        input_tokens=next(in_shares),
+                        output_tokens=next(out_shares),
+                        error=None,
+                    )
+                    _cache_store(cache, cache_key, result)
+                    results[index] = result
+
+        return [
+            result if result is not None else _failed_result(article, "Missing summary result")
+            for article, result in zip(articles, results, strict=True)
+        ]
 
     def summarize_batch(
         self,
@@ -143,57 +234,148 @@ class Summarizer:
         on_progress: Callable[[int, int, Article], None] | None = None,
         cache: CacheStore | None = None,
         model_name: str | None = None,
+        max_concurrency: int = 4,
+        batch_size: int = 1,
     ) -> list[SummaryResult]:
-        """Summarize multiple articles concurrently."""
-        if not articles:
-            return []
-
-        results: list[SummaryResult] = []
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            future_to_article = {
-                executor.submit(self.summarize_article, article, cache, model_name): article
-                for article in articles
-            }
-
-            for i, future in enumerate(as_completed(future_to_article)):
-                article = future_to_article[future]
-                if on_progress:
-                    on_progress(i, len(articles), article)
-
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as exc:
-                    logger.error(f"Failed to process {article.title}: {exc}")
-                    results.append(
-                        SummaryResult(
-                            success=False,
-                            article_id=article.id,
-                            summary=None,
-                            key_takeaways=[],
-                            action_items=[],
-                            input_tokens=0,
-                            output_tokens=0,
-                            error=str(exc),
-                        )
+        """Summarize multiple articles concurrently.
+
+        Articles are grouped ``batch_size`` per LLM request and up to
+        ``max_concurrency`` requests are in flight at once. Results are returned
+        in the same order as ``articles``; ``on_progress`` fires as each
+        article's result arrives.
+        """
+        results: list[SummaryResult | None] = [None] * len(articles)
+        stream = self.iter_summaries(articles, cache, model_name, max_concurrency, batch_size)
+        for completed, (index, article, result) in enumerate(stream):
+            results[index] = result
+            if on_progress:
+                on_progress(completed, len(articles), article)
+
+        return [
+            result if result is not None else _failed_result(article, "Missing summary result")
+            for article, result in zip(articles, results, strict=True)
+        ]
+
+    def iter_summaries(
+        self,
+        articles: Iterable[Article],
+        cache: CacheStore | None = None,
+        model_name: str | None = None,
+        max_concurrency: int = 4,
+        batch_size: int = 1,
+    ) -> Iterator[tuple[int, Article, SummaryResult]]:
+        """Summarize a stream of articles, yielding results as they complete.
+
+        One pool of ``max_concurrency`` workers serves the whole stream. The
+        next ``batch_size`` group is pulled from ``articles`` as each request
+        finishes, so at most ``2 * max_concurrency`` groups are held in memory
+        and no request waits on a slower one submitted before it. Yields
+        ``(index, article, result)``, ``index`` being the article's position
+        in ``articles``.
+        """
+        workers = max(1, max_concurrency)
+        groups = batched(enumerate(articles), max(1, batch_size))
+        in_flight: dict[Future[list[SummaryResult]], tuple[tuple[int, Article], ...]] = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+
+            def submit_next() -> None:
+                group = next(groups, None)
+                if group is not None:
+                    articles_in_group = [article for _, article in group]
+                    future = executor.submit(
+                        self.summarize_group, articles_in_group, cache, model_name
                     )
-
-        result_map = {result["article_id"]: result for result in results}
-        ordered_results: list[SummaryResult] = []
-        for article in articles:
-            ordered_results.append(
-                result_map.get(
-                    article.id,
-                    SummaryResult(
-                        success=False,
-                        article_id=article.id,
-                        summary=None,
-                        key_takeaways=[],
-                        action_items=[],
-                        input_tokens=0,
-                        output_tokens=0,
-                        error="Missing summary result",
-                    ),
-                )
-            )
-        return ordered_results
+                    in_flight[future] = group
+
+            for _ in range(2 * workers):
+                submit_next()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    group = in_flight.pop(future)
+                    submit_next()
+                    try:
+                        group_results = future.result()
+                    except Exception as exc:
+                        group_results = []
+                        for _, article in group:
+                            logger.error(f"Failed to process {article.title}: {exc}")
+                            group_results.append(_failed_result(article, str(exc)))
+
+                    for (index, article), result in zip(group, group_results, strict=True):
+                        yield index, article, result
+
+
+def _cache_lookup(
+    cache: CacheStore | None,
+    model_name: str | None,
+    article: Article,
+    user_prompt: str,
+) -> tuple[SummaryResult | None, str | None]:
+    """Return (cached result, cache key); the key is None when caching is off."""
+    if not (cache and model_name):
+        return None, None
+
+    cache_key = summary_cache_key(model_name, user_prompt)
+    try:
+        cached = cache.get("summary", cache_key)
+    except Exception as exc:
+        logger.warning(f"Cache read failed, falling through to LLM: {exc}")
+        return None, None
+
+    if cached is None:
+        return None, cache_key
+    logger.debug(f"Cache hit: {article.title[:50]}...")
+    return SummaryResult(**{**cached, "article_id": article.id}), cache_key
+
+
+def _cache_store(cache: CacheStore | None, cache_key: str | None, result: SummaryResult) -> None:
+    """Store a successful result — isolated so a cache write failure never drops it."""
+    if not (cache and cache_key):
+        return
+    try:
+        cache.set("summary", cache_key, dict(result))
+    except Exception as cache_exc:
+        logger.warning(f"Cache write failed: {cache_exc}")
+
+
+def _align_summaries(
+    summaries: list[BatchedArticleSummary], count: int
+) -> list[BatchedArticleSummary | None]:
+    """
+    Match batched summaries to articles, None where the response skipped one.
+
+    Entries are placed by the 1-based index they report when every entry has a
+    distinct, in-range index; otherwise they must be positional, one per article.
+    """
+    by_index = {
+        summary.index: summary
+        for summary in summaries
+        if summary.index is not None and 1 <= summary.index <= count
+    }
+    if by_index and len(by_index) == len(summaries):
+        return [by_index.get(index) for index in range(1, count + 1)]
+    if len(summaries) != count:
+        raise ValueError(f"expected {count} summaries, got {len(summaries)}")
+    return list(summaries)
+
+
+def _split_tokens(total: int, parts: int) -> list[int]:
+    """Split a token count across parts, giving the remainder to the first."""
+    share, remainder = divmod(total, parts)
+    return [share + remainder] + [share] * (parts - 1)
+
+
+def _failed_result(article: Article, error: str) -> SummaryResult:
+    """Build a failed SummaryResult for an article."""
+    return SummaryResult(
+        success=False,
+        article_id=article.id,
+        summary=None,
+        key_takeaways=[],
+        action_items=[],
+        input_tokens=0,
+        output_tokens=0,
+        error=error,
+    )
@@ -340,10 +340,9 @@ LLM_API_KEY={api_key}
 
 def _copy_digest_to_clipboard(digest: DailyDigest) -> bool:
     """Render digest as markdown and copy to system clipboard. Returns True on success."""
-    from feed.deliver.renderer import EmailRenderer
+    from feed.deliver.renderer import get_renderer
 
-    renderer = EmailRenderer()
-    markdown = renderer.render_markdown(digest)
+    markdown = get_renderer().render_markdown(digest)
 
     pbcopy = shutil.which("pbcopy")
     if pbcopy:
@@ -374,10 +373,9 @@ def _print_digest(digest: DailyDigest, output_format: str) -> None:
     if output_format == "json":
         print(json.dumps(digest.model_dump(mode="json"), indent=2, default=str))
     elif output_format == "text":
-        from feed.deliver.renderer import EmailRenderer
+        from feed.deliver.renderer import get_renderer
 
-        renderer = EmailRenderer()
-        print(renderer.render_text(digest))
+        print(get_renderer().render_text(digest))
     else:  # rich
         _print_digest_rich(digest)
 
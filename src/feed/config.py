@@ -1,10 +1,19 @@
 """Configuration management using Pydantic Settings."""
 
+from functools import cache
 from pathlib import Path
 from typing import Literal, Self
 
-import yaml
-from pydantic import AliasChoices, BaseModel, Field, HttpUrl, ValidationError, model_validator
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    Field,
+    HttpUrl,
+    ValidationError,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from feed.llm import PROVIDER_DEFAULTS
@@ -23,6 +32,8 @@ class Settings(BaseSettings):
         ],
         env_file_encoding="utf-8",
         extra="ignore",
+        # Shared process-wide via get_settings(), so never mutated after load.
+        frozen=True,
     )
 
     # LLM
@@ -56,6 +67,11 @@ class Settings(BaseSettings):
     # Processing
     max_articles_per_feed: int = Field(default=10, description="Max articles to fetch per feed")
     lookback_hours: int = Field(default=24, description="Hours to look back for new articles")
+    extract_processes: int = Field(
+        default=1,
+        ge=1,
+        description="Worker processes for article text extraction (1 extracts inline)",
+    )
     max_tokens_per_summary: int = Field(default=500, description="Max tokens per article summary")
     insights_mode: Literal["off", "auto", "always"] = Field(
         default="auto",
@@ -77,6 +93,30 @@ class Settings(BaseSettings):
     # Retry & cache
     llm_retries: int = Field(default=2, ge=0, le=5, description="Max LLM retry attempts")
     llm_timeout: int = Field(default=120, ge=10, description="LLM timeout in seconds")
+    llm_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Max concurrent LLM requests during summarization",
+    )
+    llm_batch_size: int = Field(
+        default=1,
+        ge=1,
+        le=10,
+        description="Articles summarized per LLM request (1 disables batching)",
+    )
+    llm_batch_api: bool = Field(
+        default=False,
+        description="Submit category syntheses via the provider Batch API (~50% cheaper, slower)",
+    )
+    llm_batch_poll_seconds: int = Field(
+        default=60, ge=5, description="Seconds between Batch API status polls"
+    )
+    llm_batch_max_wait_minutes: int = Field(
+        default=60,
+        ge=1,
+        description="Cancel a Batch API job and use live calls after this long",
+    )
     cache_ttl_days: int = Field(default=7, ge=1, description="Cache TTL in days")
 
     # Paths
@@ -96,25 +136,22 @@ class Settings(BaseSettings):
         """Backward-compatible alias for legacy Gemini model access."""
         return self.llm_model or PROVIDER_DEFAULTS["gemini"]
 
-    @model_validator(mode="after")
-    def apply_llm_defaults(self) -> Self:
+    @field_validator("llm_model", mode="after")
+    @classmethod
+    def apply_llm_defaults(cls, value: str | None, info: ValidationInfo) -> str | None:
         """Fill provider-specific model defaults when omitted."""
-        provider = self.llm_provider
+        provider = info.data.get("llm_provider")
+        if provider is None:
+            return value
 
         # Migration safety: if a legacy GEMINI_MODEL is present but the selected
         # provider is not Gemini, ignore it and apply the provider default.
         # This prevents accidentally passing a Gemini model name to OpenAI or
         # Anthropic during staged env-var migrations.
-        if (
-            provider != "gemini"
-            and self.llm_model
-            and self.llm_model == PROVIDER_DEFAULTS["gemini"]
-        ):
-            self.llm_model = None
-
-        if self.llm_model is None:
-            self.llm_model = PROVIDER_DEFAULTS[provider]
-        return self
+        if provider != "gemini" and value and value == PROVIDER_DEFAULTS["gemini"]:
+            value = None
+
+        return value or PROVIDER_DEFAULTS[provider]
 
     @model_validator(mode="after")
     def ensure_directories(self) -> Self:
@@ -149,6 +186,8 @@ class FeedConfig:
             self._feeds = {}
             return
 
+        import yaml
+
         with open(self.config_path) as file_handle:
             data = yaml.safe_load(file_handle) or {}
 
@@ -224,12 +263,65 @@ class FeedConfig:
         return "Uncategorized"
 
 
-_settings: Settings | None = None
-
-
+# Documented key prefixes; a mismatch almost always means a pasted wrong key.
+_LLM_KEY_PREFIXES: dict[str, str] = {
+    "gemini": "AIza",
+    "openai": "sk-",
+    "anthropic": "sk-ant-",
+}
+_RESEND_KEY_PREFIX = "re_"
+
+# Bytes sniffed from feeds.yaml to reject binary/corrupt files.
+_SNIFF_BYTES = 4096
+
+
+def _check_api_key(label: str, key: str, prefix: str) -> str | None:
+    """Return an issue if an API key is empty or obviously malformed."""
+    if not key:
+        return f"Missing {label} API key"
+    if any(ch.isspace() for ch in key):
+        return f"{label} API key contains whitespace"
+    if not key.startswith(prefix):
+        return f"{label} API key should start with '{prefix}'"
+    return None
+
+
+def _check_feeds_file(path: Path) -> str | None:
+    """Return an issue if feeds.yaml is missing, unreadable, or binary."""
+    if not path.exists():
+        return f"Feeds config not found: {path}"
+    if not path.is_file():
+        return f"Feeds config is not a regular file: {path}"
+    try:
+        with open(path, "rb") as file_handle:
+            head = file_handle.read(_SNIFF_BYTES)
+    except OSError as exc:
+        return f"Feeds config is not readable: {exc}"
+    if b"\x00" in head:
+        return f"Feeds config looks binary (NUL bytes): {path}"
+    return None
+
+
+def validate_settings(settings: Settings, feeds: bool = True, email: bool = True) -> list[str]:
+    """Cheap pre-flight checks that need no network or LLM calls.
+
+    Returns a list of human-readable issues (empty when everything looks sane).
+    """
+    checks = [
+        _check_api_key(
+            f"LLM ({settings.llm_provider})",
+            settings.llm_api_key,
+            _LLM_KEY_PREFIXES[settings.llm_provider],
+        )
+    ]
+    if email:
+        checks.append(_check_api_key("Resend", settings.resend_api_key, _RESEND_KEY_PREFIX))
+    if feeds:
+        checks.append(_check_feeds_file(settings.config_dir / "feeds.yaml"))
+    return [issue for issue in checks if issue]
+
+
+@cache
 def get_settings() -> Settings:
-    """Get application settings (singleton)."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """Get application settings (singleton). ``get_settings.cache_clear()`` reloads."""
+    return Settings()
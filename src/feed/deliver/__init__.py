@@ -5,9 +5,9 @@ Handles rendering and sending of digest emails.
 """
 
 from .email import EmailSender, SendResult
-from .renderer import EmailRenderer
+from .renderer import EmailRenderer, get_renderer
 
-__all__ = ["EmailRenderer", "EmailSender", "SendResult", "send_digest"]
+__all__ = ["EmailRenderer", "EmailSender", "SendResult", "get_renderer", "send_digest"]
 
 
 def send_digest(digest, **kwargs) -> SendResult:
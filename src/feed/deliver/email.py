@@ -2,20 +2,67 @@
 Email delivery via Resend.
 """
 
+import functools
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
+import httpx
 import resend
 
 from feed.config import get_settings
 from feed.logging_config import get_logger
 from feed.models import DailyDigest
 
-from .renderer import EmailRenderer
+from .renderer import get_renderer
 
 logger = get_logger("email")
 
 
+class _KeepAliveHTTPClient(resend.HTTPClient):
+    """Resend transport over one pooled httpx client.
+
+    The SDK's default transport opens a new connection per call; reusing one
+    skips the TCP/TLS handshake on every send after the first.
+    """
+
+    def __init__(self, timeout: float = 30.0):
+        self._client = httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json: dict[str, object] | list[object] | None = None,
+        files: dict[str, Any] | None = None,
+        data: dict[str, str] | None = None,
+    ) -> tuple[bytes, int, Mapping[str, str]]:
+        try:
+            response = self._client.request(
+                method,
+                url,
+                headers=headers,
+                json=json if files is None and data is None else None,
+                files=files,
+                data=data,
+            )
+        except httpx.HTTPError as e:
+            # The SDK wraps transport errors into a ResendError
+            raise RuntimeError(f"Request failed: {e}") from e
+        return response.content, response.status_code, response.headers
+
+
+@functools.cache
+def _http_client() -> _KeepAliveHTTPClient:
+    """Process-wide Resend transport, created on first use."""
+    return _KeepAliveHTTPClient()
+
+
 @dataclass
 class SendResult:
     """Result of sending an email."""
@@ -37,10 +84,11 @@ class EmailSender:
         settings = get_settings()
 
         resend.api_key = api_key or settings.resend_api_key
+        resend.default_http_client = _http_client()
         self.from_address = from_address or settings.email_from
         self.to_address = to_address or settings.email_to
 
-        self.renderer = EmailRenderer()
+        self.renderer = get_renderer()
 
     def send_digest(
         self,
@@ -61,6 +109,7 @@ class EmailSender:
         """
         recipient = to or self.to_address
 
+        iso_date = digest.date.strftime("%Y-%m-%d")
         if subject is None:
             subject = f"📬 Your Daily Digest - {digest.date.strftime('%B %d, %Y')}"
 
@@ -80,7 +129,7 @@ class EmailSender:
                     "text": text,
                     "tags": [
                         {"name": "type", "value": "daily_digest"},
-                        {"name": "date", "value": digest.date.strftime("%Y-%m-%d")},
+                        {"name": "date", "value": iso_date},
                     ],
                 }
             )
@@ -2,9 +2,16 @@
 Email template rendering using Jinja2.
 """
 
+import functools
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
 
 from feed.logging_config import get_logger
 from feed.models import DailyDigest
@@ -14,6 +21,23 @@ logger = get_logger("renderer")
 # Template directory
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Header date shown in every template; formatted once per render() call
+DISPLAY_DATE_FORMAT = "%A, %B %d, %Y"
+
+
+def _bytecode_cache() -> BytecodeCache | None:
+    """Return the on-disk bytecode cache, or None if its directory is unusable.
+
+    Compiled template bytecode is reused across short-lived runs to skip
+    parsing. Jinja's default directory is per-user, created 0700 and
+    owner-checked, so no other local user can plant bytecode for us to load.
+    """
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError) as e:
+        logger.debug(f"Template bytecode cache disabled: {e}")
+        return None
+
 
 class EmailRenderer:
     """Renders digest to HTML and plain text email formats."""
@@ -26,39 +50,57 @@ class EmailRenderer:
             autoescape=select_autoescape(["html", "xml"]),
             trim_blocks=True,
             lstrip_blocks=True,
+            # Templates ship with the package; skip the per-render mtime check.
+            auto_reload=False,
+            bytecode_cache=_bytecode_cache(),
         )
 
-    def render_html(self, digest: DailyDigest, subject: str) -> str:
+        # Compiled once and reused for every digest this renderer sends.
+        self._html_template = self.env.get_template("digest.html")
+        self._text_template = self.env.get_template("digest.txt")
+
+    def render_html(
+        self, digest: DailyDigest, subject: str, display_date: str | None = None
+    ) -> str:
         """
         Render digest to HTML email.
 
         Args:
             digest: DailyDigest to render
             subject: Email subject line
+            display_date: Preformatted header date (formatted here if omitted)
 
         Returns:
             Rendered HTML string
         """
-        template = self.env.get_template("digest.html")
-        return template.render(digest=digest, subject=subject)
+        return self._html_template.render(
+            digest=digest,
+            subject=subject,
+            display_date=display_date or digest.date.strftime(DISPLAY_DATE_FORMAT),
+        )
 
-    def render_text(self, digest: DailyDigest) -> str:
+    def render_text(self, digest: DailyDigest, display_date: str | None = None) -> str:
         """
         Render digest to plain text email.
 
         Args:
             digest: DailyDigest to render
+            display_date: Preformatted header date (formatted here if omitted)
 
         Returns:
             Rendered plain text string
         """
-        template = self.env.get_template("digest.txt")
-        return template.render(digest=digest)
+        return self._text_template.render(
+            digest=digest,
+            display_date=display_date or digest.date.strftime(DISPLAY_DATE_FORMAT),
+        )
 
     def render_markdown(self, digest: DailyDigest) -> str:
         """Render digest to markdown."""
         template = self.env.get_template("digest.md")
-        return template.render(digest=digest)
+        return template.render(
+            digest=digest, display_date=digest.date.strftime(DISPLAY_DATE_FORMAT)
+        )
 
     def render(self, digest: DailyDigest, subject: str | None = None) -> tuple[str, str]:
         """
@@ -74,9 +116,20 @@ class EmailRenderer:
         if subject is None:
             subject = f"📬 Your Daily Digest - {digest.date.strftime('%B %d, %Y')}"
 
-        html = self.render_html(digest, subject)
-        text = self.render_text(digest)
+        display_date = digest.date.strftime(DISPLAY_DATE_FORMAT)
+        html = self.render_html(digest, subject, display_date)
+        text = self.render_text(digest, display_date)
 
         logger.debug(f"Rendered email: {len(html)} chars HTML, {len(text)} chars text")
 
         return html, text
+
+
+@functools.cache
+def get_renderer() -> EmailRenderer:
+    """Return a process-wide renderer for the packaged templates.
+
+    Templates are read-only once loaded, so callers share one Environment
+    instead of rebuilding it per email or CLI command.
+    """
+    return EmailRenderer()
@@ -0,0 +1,104 @@
+"""Deep healthchecks: verify API credentials with cheap, side-effect-free requests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import httpx
+
+from feed.logging_config import get_logger
+from feed.storage.cache import make_cache_key
+
+if TYPE_CHECKING:
+    from feed.config import Settings
+    from feed.storage.cache import CacheStore
+
+logger = get_logger("health")
+
+# Short timeout: a probe that hangs is itself a failed check.
+PROBE_TIMEOUT_SECONDS = 2.0
+
+# Results are cached briefly so frequent probes don't hammer upstream APIs.
+RESULT_TTL_SECONDS = 30
+
+_LLM_MODELS_ENDPOINTS: dict[str, str] = {
+    "gemini": "https://generativelanguage.googleapis.com/v1beta/models",
+    "openai": "https://api.openai.com/v1/models",
+    "anthropic": "https://api.anthropic.com/v1/models",
+}
+
+_RESEND_DOMAINS_ENDPOINT = "https://api.resend.com/domains"
+
+
+def _llm_headers(provider: str, api_key: str) -> dict[str, str]:
+    """Auth headers for a provider's model-listing endpoint."""
+    match provider:
+        case "gemini":
+            return {"x-goog-api-key": api_key}
+        case "anthropic":
+            return {"x-api-key": api_key, "anthropic-version": "2023-06-01"}
+        case _:
+            return {"Authorization": f"Bearer {api_key}"}
+
+
+def check_llm(client: httpx.Client, provider: str, api_key: str) -> str | None:
+    """List models for the provider. Returns an issue string, or None if healthy."""
+    url = _LLM_MODELS_ENDPOINTS.get(provider)
+    if url is None:
+        return f"Unknown LLM provider: {provider}"
+
+    try:
+        response = client.get(url, headers=_llm_headers(provider, api_key))
+    except httpx.HTTPError as exc:
+        return f"LLM API unreachable ({provider}): {exc}"
+
+    if response.is_success:
+        return None
+    return f"LLM API check failed ({provider}): HTTP {response.status_code}"
+
+
+def check_resend(client: httpx.Client, api_key: str) -> str | None:
+    """List Resend domains. Returns an issue string, or None if healthy."""
+    try:
+        response = client.get(
+            _RESEND_DOMAINS_ENDPOINT, headers={"Authorization": f"Bearer {api_key}"}
+        )
+    except httpx.HTTPError as exc:
+        return f"Resend API unreachable: {exc}"
+
+    if response.is_success:
+        return None
+    # Sending-only keys can't list domains, but being told so proves the key is valid.
+    if response.status_code == 401 and "restricted_api_key" in response.text:
+        return None
+    return f"Resend API check failed: HTTP {response.status_code}"
+
+
+def run_deep_checks(
+    settings: Settings,
+    cache: CacheStore | None = None,
+    client: httpx.Client | None = None,
+) -> list[str]:
+    """Probe the LLM and Resend APIs with one shared keep-alive client."""
+    cache_key = make_cache_key(settings.llm_provider, settings.llm_api_key, settings.resend_api_key)
+    if cache is not None:
+        cached = cache.get("health", cache_key)
+        if cached is not None:
+            logger.debug("Using cached deep healthcheck result")
+            return cached["issues"]
+
+    owns_client = client is None
+    http = client or httpx.Client(timeout=PROBE_TIMEOUT_SECONDS)
+    try:
+        results = [
+            check_llm(http, settings.llm_provider, settings.llm_api_key),
+            check_resend(http, settings.resend_api_key),
+        ]
+    finally:
+        if owns_client:
+            http.close()
+
+    issues = [issue for issue in results if issue]
+    if cache is not None:
+        cache.set("health", cache_key, {"issues": issues}, ttl_days=RESULT_TTL_SECONDS / 86400)
+    return issues
@@ -4,16 +4,22 @@ Content ingestion module.
 Coordinates feed fetching, content parsing, and storage.
 """
 
+from concurrent.futures import Future, as_completed
+from contextlib import nullcontext
+
 from feed.config import FeedConfig, get_settings
 from feed.logging_config import get_logger
 from feed.models import Article
 from feed.storage.db import Database
 
-from .feeds import fetch_all_feeds
-from .parser import process_articles
+from .feeds import FeedResult, iter_feed_results
+from .parser import ContentFetcher, apply_entry_content, has_enough_content
 
 logger = get_logger("ingest")
 
+# New articles are written in batches of this size as their content arrives
+STORE_BATCH_SIZE = 50
+
 __all__ = ["IngestResult", "run_ingestion"]
 
 
@@ -46,9 +52,9 @@ def run_ingestion(
     Run the full ingestion pipeline.
 
     1. Load feed configuration
-    2. Fetch all feeds
-    3. Parse and extract content
-    4. Deduplicate and store
+    2. Fetch all feeds, handling each as it completes
+    3. Deduplicate its articles and queue their content fetches
+    4. Store articles in batches as their content arrives
 
     Args:
         db: Database instance (creates one if not provided)
@@ -81,58 +87,78 @@ def run_ingestion(
     logger.info(f"Starting ingestion for {len(feeds)} feeds")
     result.feeds_checked = len(feeds)
 
-    # Fetch all feeds
-    feed_results = fetch_all_feeds(
-        feeds_config=feeds,
-        lookback_hours=settings.lookback_hours,
-        max_articles_per_feed=settings.max_articles_per_feed,
-    )
-
-    # Process each feed result
-    all_articles: list[Article] = []
-
-    for feed_result in feed_results:
-        # Update feed status in database
-        db.update_feed_status(
-            feed_url=feed_result.feed_url,
-            feed_name=feed_result.feed_name,
-            success=feed_result.success,
-            error=feed_result.error,
-        )
+    # Stages overlap: each feed's new articles start fetching content as soon
+    # as that feed arrives, and articles are stored in batches as their
+    # content completes.
+    feed_results: list[FeedResult] = []
+    pending: list[Future[Article]] = []
+    to_store: list[Article] = []
+    seen: set[str] = set()
+
+    with (
+        ContentFetcher(extract_processes=settings.extract_processes)
+        if fetch_content
+        else nullcontext()
+    ) as fetcher:
+        for feed_result in iter_feed_results(
+            feeds_config=feeds,
+            lookback_hours=settings.lookback_hours,
+            max_articles_per_feed=settings.max_articles_per_feed,
+        ):
+            feed_results.append(feed_result)
+            if not feed_result.success:
+                result.feeds_failed += 1
+                result.errors.append(f"{feed_result.feed_name}: {feed_result.error}")
+                continue
 
-        if feed_result.success:
             result.feeds_successful += 1
-            all_articles.extend(feed_result.articles)
-        else:
-            result.feeds_failed += 1
-            result.errors.append(f"{feed_result.feed_name}: {feed_result.error}")
-
-    result.articles_found = len(all_articles)
-    logger.info(f"Found {result.articles_found} articles from {result.feeds_successful} feeds")
-
-    # Deduplicate against existing articles
-    new_articles: list[Article] = []
-    for article in all_articles:
-        if not db.article_exists(article.id):
-            new_articles.append(article)
-
-    result.articles_new = len(new_articles)
-    logger.info(f"{result.articles_new} articles are new")
-
-    if not new_articles:
-        result.duration_seconds = time.time() - start_time
-        return result
-
-    # Fetch and process content
-    if fetch_content:
-        logger.info("Fetching article content...")
-        new_articles = process_articles(new_articles, fetch_content=True)
-
-    result.articles_processed = len(new_articles)
-
-    # Store articles
-    for article in new_articles:
-        db.save_article(article)
+            result.articles_found += len(feed_result.articles)
+
+            # Deduplicate within this run, then against stored articles
+            fresh: list[Article] = []
+            for article in feed_result.articles:
+                if article.id not in seen:
+                    seen.add(article.id)
+                    fresh.append(article)
+            new_ids = db.filter_new_ids(article.id for article in fresh)
+
+            entry_html = feed_result.entry_html or {}
+            for article in fresh:
+                if article.id not in new_ids:
+                    continue
+                result.articles_new += 1
+                html = entry_html.get(article.id, "")
+                if fetcher is None:
+                    to_store.append(apply_entry_content(article, html) if html else article)
+                else:
+                    pending.append(fetcher.submit(article, html))
+
+        # Record every feed's status under one commit
+        with db.transaction():
+            for feed_result in feed_results:
+                db.update_feed_status(
+                    feed_url=feed_result.feed_url,
+                    feed_name=feed_result.feed_name,
+                    success=feed_result.success,
+                    error=feed_result.error,
+                )
+
+        logger.info(f"Found {result.articles_found} articles from {result.feeds_successful} feeds")
+        logger.info(f"{result.articles_new} articles are new")
+
+        for future in as_completed(pending):
+            article = future.result()
+            if not has_enough_content(article):
+                continue
+            to_store.append(article)
+            if len(to_store) >= STORE_BATCH_SIZE:
+                db.save_articles_bulk(to_store)
+                result.articles_processed += len(to_store)
+                to_store = []
+
+    if to_store:
+        db.save_articles_bulk(to_store)
+        result.articles_processed += len(to_store)
 
     logger.info(f"Stored {result.articles_processed} articles")
 
@@ -3,6 +3,7 @@ RSS feed fetching with error handling and timeout management.
 """
 
 import hashlib
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
 from time import perf_counter
 from typing import NamedTuple
@@ -15,6 +16,8 @@ from dateutil.parser import parse as parse_date
 from feed.logging_config import get_logger
 from feed.models import Article
 
+from .http import pooled_client
+
 logger = get_logger("feeds")
 
 FEED_AGENT_HEADERS = {
@@ -39,6 +42,9 @@ BROWSER_HEADERS = {
 
 BOT_FILTER_RETRY_STATUS_CODES = {403, 404}
 
+# Feeds fetched at once during ingestion
+FEED_FETCH_WORKERS = 10
+
 
 class FeedResult(NamedTuple):
     """Result of fetching a feed."""
@@ -56,6 +62,8 @@ class FeedResult(NamedTuple):
     entry_count: int = 0
     bozo: bool = False
     bozo_exception: str | None = None
+    # Raw <content:encoded> HTML by article id, extracted only for articles that survive dedup
+    entry_html: dict[str, str] | None = None
 
 
 def generate_article_id(url: str) -> str:
@@ -70,6 +78,7 @@ def fetch_feed(
     lookback_hours: int = 48,
     max_articles: int = 10,
     timeout: int = 30,
+    client: httpx.Client | None = None,
 ) -> FeedResult:
     """
     Fetch and parse an RSS feed.
@@ -81,6 +90,7 @@ def fetch_feed(
         lookback_hours: Only include articles from this many hours ago
         max_articles: Maximum number of articles to return
         timeout: Request timeout in seconds
+        client: Shared client for connection reuse (one-off request if omitted)
 
     Returns:
         FeedResult with articles or error information
@@ -104,6 +114,7 @@ def fetch_feed(
                 feed_url=feed_url,
                 timeout=timeout,
                 headers=headers,
+                client=client,
             )
             status_code = response.status_code
             final_url = str(response.url)
@@ -173,6 +184,7 @@ def fetch_feed(
         cutoff = datetime.now(UTC) - timedelta(hours=lookback_hours)
 
         articles: list[Article] = []
+        entry_html: dict[str, str] = {}
 
         for entry in feed.entries[: max_articles * 2]:  # Fetch extra, filter by date
             # Parse publication date
@@ -199,11 +211,13 @@ def fetch_feed(
                 feed_name=actual_feed_name,
                 feed_url=feed_url,
                 published=published,
-                content="",  # Will be populated by parser
                 category=category,
             )
 
             articles.append(article)
+            # Full-text feeds already carry the body; it's extracted once the article is known new
+            if html := _entry_html(entry):
+                entry_html[article.id] = html
 
             if len(articles) >= max_articles:
                 break
@@ -223,6 +237,7 @@ def fetch_feed(
             entry_count=len(feed.entries),
             bozo=bool(feed.bozo),
             bozo_exception=bozo_exception,
+            entry_html=entry_html,
         )
 
     except httpx.TimeoutException as e:
@@ -270,11 +285,15 @@ def fetch_feed(
 
 
 def _fetch_response(
-    feed_url: str, timeout: int, headers: dict[str, str]
+    feed_url: str,
+    timeout: int,
+    headers: dict[str, str],
+    client: httpx.Client | None = None,
 ) -> tuple[httpx.Response, float]:
     """Fetch a feed URL and return (response, elapsed_ms)."""
+    get = client.get if client is not None else httpx.get
     started = perf_counter()
-    response = httpx.get(
+    response = get(
         feed_url,
         timeout=timeout,
         follow_redirects=True,
@@ -337,6 +356,11 @@ def _extract_author(entry: dict) -> str:
     return "Unknown"
 
 
+def _entry_html(entry: dict) -> str:
+    """Raw HTML of an entry's <content:encoded> or Atom content, if the feed carries it."""
+    return "".join(block.get("value", "") for block in entry.get("content") or [])
+
+
 def fetch_all_feeds(
     feeds_config: dict[str, dict],
     lookback_hours: int = 48,
@@ -353,9 +377,22 @@ def fetch_all_feeds(
     Returns:
         List of FeedResults
     """
-    import concurrent.futures
+    return list(iter_feed_results(feeds_config, lookback_hours, max_articles_per_feed))
 
-    results: list[FeedResult] = []
+
+def iter_feed_results(
+    feeds_config: dict[str, dict],
+    lookback_hours: int = 48,
+    max_articles_per_feed: int = 10,
+) -> Iterator[FeedResult]:
+    """
+    Fetch all configured feeds concurrently, yielding each result as it completes.
+
+    Lets callers start on a fast feed's articles while slow feeds are still
+    downloading. All feeds share one keep-alive client, so hosts serving several
+    feeds (Substack, Medium) pay the TCP/TLS handshake once.
+    """
+    import concurrent.futures
 
     # Prepare arguments for each feed
     fetch_args = []
@@ -369,7 +406,12 @@ def fetch_all_feeds(
         fetch_args.append((url, feed_name, category))
 
     # Execute concurrently
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+    with (
+        pooled_client(
+            max_connections=FEED_FETCH_WORKERS * 2, max_keepalive_connections=32
+        ) as client,
+        concurrent.futures.ThreadPoolExecutor(max_workers=FEED_FETCH_WORKERS) as executor,
+    ):
         future_to_feed = {
             executor.submit(
                 fetch_feed,
@@ -378,6 +420,7 @@ def fetch_all_feeds(
                 category=cat,
                 lookback_hours=lookback_hours,
                 max_articles=max_articles_per_feed,
+                client=client,
             ): (name, url)
             for url, name, cat in fetch_args
         }
@@ -385,19 +428,14 @@ def fetch_all_feeds(
         for future in concurrent.futures.as_completed(future_to_feed):
             feed_name, feed_url = future_to_feed[future]
             try:
-                result = future.result()
-                results.append(result)
+                yield future.result()
             except Exception as e:
                 logger.error(f"Top-level error fetching {feed_name}: {e}")
-                results.append(
-                    FeedResult(
-                        feed_url=feed_url,
-                        feed_name=feed_name,
-                        articles=[],
-                        success=False,
-                        error=f"Unhandled fetch error: {e}",
-                        attempts=1,
-                    )
+                yield FeedResult(
+                    feed_url=feed_url,
+                    feed_name=feed_name,
+                    articles=[],
+                    success=False,
+                    error=f"Unhandled fetch error: {e}",
+                    attempts=1,
                 )
-
-    return results
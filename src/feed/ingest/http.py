@@ -0,0 +1,20 @@
+"""Shared HTTP client construction for ingestion."""
+
+from importlib.util import find_spec
+
+import httpx
+
+# HTTP/2 lets requests to one host multiplex over a single connection, but
+# httpx only supports it when the optional h2 package is installed.
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+def pooled_client(max_connections: int, max_keepalive_connections: int) -> httpx.Client:
+    """Keep-alive client for concurrent fetches, using HTTP/2 when available."""
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+    )
@@ -4,85 +4,130 @@ Article content extraction and cleaning.
 Handles HTML parsing, text extraction, and content normalization.
 """
 
+import codecs
+import multiprocessing
 import re
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import urlsplit
 
 import httpx
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
 from feed.logging_config import get_logger
 from feed.models import Article
 
+from .http import pooled_client
+
 logger = get_logger("parser")
 
 # Tags to remove entirely (including content)
-REMOVE_TAGS = {
-    "script",
-    "style",
-    "nav",
-    "header",
-    "footer",
-    "aside",
-    "form",
-    "button",
-    "input",
-    "iframe",
-    "noscript",
-    "svg",
-    "canvas",
-    "video",
-    "audio",
-}
+REMOVE_TAGS = frozenset(
+    {
+        "script",
+        "style",
+        "nav",
+        "header",
+        "footer",
+        "aside",
+        "form",
+        "button",
+        "input",
+        "iframe",
+        "noscript",
+        "svg",
+        "canvas",
+        "video",
+        "audio",
+    }
+)
 
 # Minimum word count to consider content valid
 MIN_WORD_COUNT = 50
 
+# Extraction stops past this many words; the summarizer only reads the first
+# 30K characters, and the tail of huge pages is mostly comments and footers
+MAX_EXTRACT_WORDS = 15_000
+
+ARTICLE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Accept": "text/html,application/xhtml+xml",
+}
+
+# Concurrent article page fetches, and the most any single host gets at once
+CONTENT_FETCH_CONCURRENCY = 16
+PER_HOST_CONCURRENCY = 4
+
+# Worker processes for HTML extraction; 1 runs it inline in the fetch threads.
+# Extraction costs ~3.4ms per 44KB page inline (3.6ms through a pool worker),
+# while spawning the pool costs ~350ms, so a pool only pays off for runs of
+# hundreds of pages on several cores and stays opt-in (EXTRACT_PROCESSES)
+EXTRACT_PROCESSES = 1
+
+# Statuses meaning a host refuses us (paywall, bot wall, legal block), not a transient error
+BLOCKED_STATUS_CODES = frozenset({403, 451})
+
 _UNICODE_WHITESPACE_RE = re.compile(r"[\u00a0\u2000-\u200b\u2028\u2029\u202f\u205f\u3000]")
 _EXCESSIVE_NEWLINES_RE = re.compile(r"\n{3,}")
 _EXCESSIVE_SPACES_RE = re.compile(r" {2,}")
+_NEWSLETTER_ARTIFACTS = [
+    r"Subscribe to .+? newsletter",
+    r"Share this post",
+    r"Leave a comment",
+    r"Read more at .+",
+    r"Click here to .+",
+    r"Unsubscribe",
+    r"View in browser",
+    r"Forward to a friend",
+]
+# The leading lookahead rejects most positions with one character-class check
+# instead of attempting every alternative there (about 3x faster on long text).
 _NEWSLETTER_ARTIFACT_RE = re.compile(
-    "|".join(
-        [
-            r"(?:Subscribe to .+? newsletter)",
-            r"(?:Share this post)",
-            r"(?:Leave a comment)",
-            r"(?:Read more at .+)",
-            r"(?:Click here to .+)",
-            r"(?:Unsubscribe)",
-            r"(?:View in browser)",
-            r"(?:Forward to a friend)",
-        ]
+    "(?=[{}])(?:{})".format(
+        "".join(sorted({pattern[0] for pattern in _NEWSLETTER_ARTIFACTS})),
+        "|".join(_NEWSLETTER_ARTIFACTS),
     ),
     flags=re.IGNORECASE,
 )
 
 
-def fetch_article_content(article: Article, timeout: int = 30) -> Article:
+def fetch_article_content(
+    article: Article,
+    timeout: int = 30,
+    client: httpx.Client | None = None,
+    extract_pool: Executor | None = None,
+) -> Article:
     """
     Fetch and parse the full content of an article.
 
     Args:
         article: Article with URL to fetch
         timeout: Request timeout in seconds
+        client: Shared client for connection reuse (one-off request if omitted)
+        extract_pool: Process pool to run text extraction on (inline if omitted)
 
     Returns:
         Article with content and word_count populated
     """
     logger.debug(f"Fetching content: {article.title}")
 
+    get = client.get if client is not None else httpx.get
     try:
-        response = httpx.get(
+        response = get(
             str(article.url),
             timeout=timeout,
             follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-                "Accept": "text/html,application/xhtml+xml",
-            },
+            headers=ARTICLE_HEADERS,
         )
         response.raise_for_status()
 
-        html = response.text
-        content = extract_text_content(html, str(article.url))
+        # Hand lxml the raw bytes so the body is decoded once, inside libxml2
+        extract_args = (response.content, str(article.url), response.charset_encoding)
+        if extract_pool is None:
+            content = extract_text_content(*extract_args)
+        else:
+            content = extract_pool.submit(extract_text_content, *extract_args).result()
         word_count = len(content.split())
 
         # Update article
@@ -101,62 +146,244 @@ def fetch_article_content(article: Article, timeout: int = 30) -> Article:
         return article
 
 
-def extract_text_content(html: str, base_url: str = "") -> str:
+class ContentFetcher:
+    """
+    Fetches article content on a worker pool as articles are submitted.
+
+    Requests share one pooled client, and each host is limited to
+    PER_HOST_CONCURRENCY in-flight requests so one publisher isn't hammered.
+    Articles whose feed already supplied enough text are not fetched, nor are
+    any more from a host that has answered with a BLOCKED_STATUS_CODES status.
+    Text extraction runs inline in the fetch threads. A process pool of
+    ``extract_processes`` workers (settings.extract_processes, EXTRACT_PROCESSES
+    env var) is started only when that is above 1, since spawning one costs
+    more than it saves for a typical run.
+    Use as a context manager; exiting waits for outstanding fetches.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = CONTENT_FETCH_CONCURRENCY,
+        extract_processes: int = EXTRACT_PROCESSES,
+    ):
+        self._client = pooled_client(
+            max_connections=max_concurrency * 2, max_keepalive_connections=max_concurrency
+        )
+        self._client.event_hooks = {"response": [self._note_blocked_host]}
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._slots_lock = threading.Lock()
+        self._blocked_hosts: set[str] = set()
+        # Spawned rather than forked: the fetch threads are already running
+        self._extract_pool = (
+            ProcessPoolExecutor(extract_processes, mp_context=multiprocessing.get_context("spawn"))
+            if extract_processes > 1
+            else None
+        )
+
+    def __enter__(self) -> "ContentFetcher":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._executor.shutdown(wait=True)
+        if self._extract_pool is not None:
+            self._extract_pool.shutdown(wait=True)
+        self._client.close()
+
+    def submit(self, article: Article, entry_html: str = "") -> Future[Article]:
+        """Queue an article for fetching; the future resolves to the updated article.
+
+        ``entry_html`` is the body its feed entry carried; when that extracts to
+        enough words, the article page is never requested.
+        """
+        if article.word_count >= MIN_WORD_COUNT:
+            done: Future[Article] = Future()
+            done.set_result(article)
+            return done
+        return self._executor.submit(self._fetch, article, entry_html)
+
+    def _note_blocked_host(self, response: httpx.Response) -> None:
+        if response.status_code in BLOCKED_STATUS_CODES:
+            self._blocked_hosts.add(response.request.url.host)
+
+    def _fetch(self, article: Article, entry_html: str = "") -> Article:
+        if entry_html:
+            apply_entry_content(article, entry_html)
+            if article.word_count >= MIN_WORD_COUNT:
+                return article
+        url = urlsplit(str(article.url))
+        if url.hostname in self._blocked_hosts:
+            logger.debug(f"Skipping blocked host {url.hostname}: {article.title}")
+            return article
+        host = url.netloc
+        with self._slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(PER_HOST_CONCURRENCY)
+        with slot:
+            return fetch_article_content(
+                article, client=self._client, extract_pool=self._extract_pool
+            )
+
+
+def apply_entry_content(article: Article, html: str) -> Article:
+    """Fill an article's content from the HTML its feed entry carried."""
+    article.content = extract_text_content(html)
+    article.word_count = len(article.content.split())
+    return article
+
+
+def fetch_all_content(
+    articles: list[Article],
+    max_concurrency: int = CONTENT_FETCH_CONCURRENCY,
+) -> list[Article]:
+    """Fetch content for many articles concurrently, preserving input order."""
+    if not articles:
+        return []
+
+    with ContentFetcher(min(max_concurrency, len(articles))) as fetcher:
+        futures = [fetcher.submit(article) for article in articles]
+        return [future.result() for future in futures]
+
+
+def has_enough_content(article: Article, min_word_count: int = MIN_WORD_COUNT) -> bool:
+    """Whether an article's extracted text is long enough to keep."""
+    if article.word_count < min_word_count:
+        logger.debug(f"Skipping article with {article.word_count} words: {article.title}")
+        return False
+    return True
+
+
+def _class_xpath(tag: str, *class_names: str) -> str:
+    """XPath matching ``tag`` elements whose class list contains every class_name."""
+    tests = " and ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')" for name in class_names
+    )
+    return f"//{tag}[{tests}]"
+
+
+_REMOVE_XPATH = etree.XPath(" | ".join(f"//{tag}" for tag in sorted(REMOVE_TAGS)))
+
+# Main content containers, most specific first; the first selector with a match wins.
+_CONTENT_XPATHS = [
+    etree.XPath(f"({expr})[1]")
+    for expr in (
+        _class_xpath("div", "body", "markup"),  # Substack posts
+        _class_xpath("article", "post"),  # Many blogs
+        _class_xpath("div", "post-content"),  # Common pattern
+        "//article",  # Semantic HTML
+        "//main",  # Semantic HTML
+        _class_xpath("div", "entry-content"),  # WordPress
+        _class_xpath("div", "article-content"),  # News sites
+    )
+]
+
+# Text-bearing tags and how each is rendered; headings get markers for context
+_TEXT_FORMATS = {
+    "p": "{}",
+    "li": "{}",
+    "blockquote": "> {}",
+    **{f"h{level}": "\n## {}\n" for level in range(1, 7)},
+}
+
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset", re.IGNORECASE)
+
+
+def _decode_body(
+    html: bytes, encoding: str | None
+) -> tuple[str | bytes, lxml.html.HTMLParser | None]:
+    """
+    Input and parser for an undecoded body: the HTTP charset wins, then the
+    document's own <meta> declaration (sniffed by libxml2), then UTF-8 rather
+    than libxml2's Latin-1 default.
+
+    libxml2 knows charsets by their IANA labels (EUC-JP) and Python by codec
+    names (euc_jp), so the header label is tried first, then the codec name; a
+    charset only Python knows is decoded here instead of being sniffed.
+    """
+    if encoding is None:
+        if _META_CHARSET_RE.search(html, 0, 2048):
+            return html, None
+        encoding = "utf-8"
+    try:
+        labels = (encoding, codecs.lookup(encoding).name)
+    except LookupError:
+        # Unknown to Python; libxml2 may still know the label, else it sniffs
+        labels = (encoding,)
+    for label in labels:
+        try:
+            return html, lxml.html.HTMLParser(encoding=label)
+        except LookupError:
+            continue
+    if len(labels) == 1:
+        return html, None
+    return html.decode(encoding, "replace"), None
+
+
+def _parse_html(html: str | bytes, encoding: str | None = None) -> lxml.html.HtmlElement | None:
+    """Parse a full HTML document, or None if there's nothing to parse."""
+    if not html.strip():
+        return None
+    parser = None
+    if isinstance(html, bytes):
+        html, parser = _decode_body(html, encoding)
+    try:
+        return lxml.html.document_fromstring(html, parser=parser)
+    except ValueError:
+        # lxml refuses str input that carries an XML encoding declaration.
+        return lxml.html.document_fromstring(
+            html.encode("utf-8"), parser=lxml.html.HTMLParser(encoding="utf-8")
+        )
+    except etree.ParserError:
+        return None
+
+
+def extract_text_content(html: str | bytes, base_url: str = "", encoding: str | None = None) -> str:
     """
     Extract clean text content from HTML.
 
     Args:
-        html: Raw HTML string
+        html: Raw HTML, either decoded or as the undecoded response body
         base_url: Base URL for resolving relative links
+        encoding: Charset from the HTTP headers, used when html is bytes
 
     Returns:
         Cleaned text content
     """
-    soup = BeautifulSoup(html, "lxml")
+    tree = _parse_html(html, encoding)
+    if tree is None:
+        return ""
 
-    # Remove unwanted tags
-    for tag in soup.find_all(REMOVE_TAGS):
-        tag.decompose()
+    # Remove unwanted tags (drop_tree keeps the text that follows them)
+    for element in _REMOVE_XPATH(tree):
+        element.drop_tree()
 
-    # Try to find main content container
+    # Try to find main content container, falling back to body
     content_element = None
-
-    # Try Substack-specific selectors first
-    for selector in [
-        "div.body.markup",  # Substack posts
-        "article.post",  # Many blogs
-        "div.post-content",  # Common pattern
-        "article",  # Semantic HTML
-        "main",  # Semantic HTML
-        "div.entry-content",  # WordPress
-        "div.article-content",  # News sites
-    ]:
-        if "." in selector:
-            tag, class_name = selector.split(".", 1)
-            content_element = soup.find(tag, class_=class_name)
-        else:
-            content_element = soup.find(selector)
-
-        if content_element:
+    for xpath in _CONTENT_XPATHS:
+        matches = xpath(tree)
+        if matches:
+            content_element = matches[0]
             break
-
-    # Fall back to body
-    if not content_element:
-        content_element = soup.body or soup
+    if content_element is None:
+        content_element = tree.find("body")
+        if content_element is None:
+            content_element = tree
 
     # Extract text with some structure
     text_parts: list[str] = []
+    total_words = 0
 
-    for element in content_element.descendants:
-        if element.name in {"p", "h1", "h2", "h3", "h4", "h5", "h6", "li", "blockquote"}:
-            text = element.get_text(separator=" ", strip=True)
-            if text:
-                # Add heading markers for context
-                if element.name.startswith("h"):
-                    text = f"\n## {text}\n"
-                elif element.name == "blockquote":
-                    text = f"> {text}"
-                text_parts.append(text)
+    # iter() filters tags inside libxml2; a compiled XPath union measured ~6x slower here
+    for element in content_element.iter(*_TEXT_FORMATS):
+        if element is content_element:
+            continue
+        text = " ".join(part for chunk in element.itertext() if (part := chunk.strip()))
+        if text:
+            text_parts.append(_TEXT_FORMATS[element.tag].format(text))
+            total_words += len(text.split())
+            if total_words > MAX_EXTRACT_WORDS:
+                break
 
     # Join and clean
     content = "\n\n".join(text_parts)
@@ -176,15 +403,16 @@ def clean_text(text: str) -> str:
     # Normalize unicode whitespace
     text = _UNICODE_WHITESPACE_RE.sub(" ", text)
 
+    # Remove common newsletter artifacts before collapsing, so the gaps they
+    # leave are squeezed too
+    text = _NEWSLETTER_ARTIFACT_RE.sub("", text)
+
     # Remove excessive newlines
     text = _EXCESSIVE_NEWLINES_RE.sub("\n\n", text)
 
     # Remove excessive spaces
     text = _EXCESSIVE_SPACES_RE.sub(" ", text)
 
-    # Remove common newsletter artifacts
-    text = _NEWSLETTER_ARTIFACT_RE.sub("", text)
-
     return text.strip()
 
 
@@ -204,17 +432,8 @@ def process_articles(
     Returns:
         List of processed articles (may be fewer than input)
     """
-    processed: list[Article] = []
-
-    for article in articles:
-        if fetch_content:
-            article = fetch_article_content(article)
-
-        # Skip articles with too little content
-        if article.word_count < min_word_count:
-            logger.debug(f"Skipping article with {article.word_count} words: {article.title}")
-            continue
-
-        processed.append(article)
+    if fetch_content:
+        articles = fetch_all_content(articles)
 
-    return processed
+    # Skip articles with too little content
+    return [article for article in articles if has_enough_content(article, min_word_count)]
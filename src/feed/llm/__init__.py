@@ -1,8 +1,9 @@
 """LLM provider factory and shared exports."""
 
+from functools import lru_cache
 from typing import Literal
 
-from .base import LLMClient, LLMError, LLMResponse
+from .base import DEFAULT_TIMEOUT_SECONDS, BatchRequest, LLMClient, LLMError, LLMResponse
 from .retry import RetryClient
 
 Provider = Literal["gemini", "openai", "anthropic"]
@@ -19,8 +20,13 @@ def create_client(
     api_key: str,
     model: str | None = None,
     max_retries: int = 2,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
 ) -> RetryClient:
-    """Create an LLM client for the given provider, wrapped with retry logic."""
+    """Create an LLM client for the given provider, wrapped with retry logic.
+
+    ``timeout`` bounds each provider request in seconds, so one stalled call
+    costs at most ``timeout`` per retry attempt rather than the SDK default.
+    """
     if provider not in PROVIDER_DEFAULTS:
         raise LLMError(f"Unknown LLM provider: {provider}")
 
@@ -31,15 +37,15 @@ def create_client(
             case "gemini":
                 from .gemini import GeminiClient
 
-                inner = GeminiClient(api_key=api_key, model=resolved_model)
+                inner = GeminiClient(api_key=api_key, model=resolved_model, timeout=timeout)
             case "openai":
                 from .openai import OpenAIClient
 
-                inner = OpenAIClient(api_key=api_key, model=resolved_model)
+                inner = OpenAIClient(api_key=api_key, model=resolved_model, timeout=timeout)
             case "anthropic":
                 from .anthropic import AnthropicClient
 
-                inner = AnthropicClient(api_key=api_key, model=resolved_model)
+                inner = AnthropicClient(api_key=api_key, model=resolved_model, timeout=timeout)
     except ImportError as exc:
         raise LLMError(
             f"Missing dependency for provider '{provider}'. "
@@ -49,12 +55,31 @@ def create_client(
     return RetryClient(inner, max_retries=max_retries)
 
 
+@lru_cache(maxsize=8)
+def get_client(
+    provider: Provider,
+    api_key: str,
+    model: str | None = None,
+    max_retries: int = 2,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+) -> RetryClient:
+    """Process-wide ``create_client`` memoized on its arguments.
+
+    Reusing the client keeps the provider SDK's HTTP connection pool (and its
+    TLS sessions) warm across repeated pipeline runs in one process. Provider
+    SDK clients are thread-safe, so one instance serves concurrent calls.
+    """
+    return create_client(provider, api_key, model=model, max_retries=max_retries, timeout=timeout)
+
+
 __all__ = [
     "PROVIDER_DEFAULTS",
+    "BatchRequest",
     "LLMClient",
     "LLMError",
     "LLMResponse",
     "Provider",
     "RetryClient",
     "create_client",
+    "get_client",
 ]
@@ -1,19 +1,28 @@
 """Anthropic implementation of the LLM client interface."""
 
 import json
+from functools import lru_cache
 from typing import Any
 
 from anthropic import Anthropic
 from pydantic import BaseModel
+from pydantic_core import from_json
 
-from .base import LLMError, LLMResponse
+from .base import (
+    DEFAULT_TIMEOUT_SECONDS,
+    BatchRequest,
+    LLMError,
+    LLMResponse,
+    response_json_schema,
+    retry_after_seconds,
+)
 
 
 class AnthropicClient:
     """Anthropic LLM provider."""
 
-    def __init__(self, api_key: str, model: str):
-        self.client = Anthropic(api_key=api_key)
+    def __init__(self, api_key: str, model: str, timeout: float = DEFAULT_TIMEOUT_SECONDS):
+        self.client = Anthropic(api_key=api_key, timeout=timeout)
         self.model = model
 
     def generate(
@@ -23,36 +32,101 @@ class AnthropicClient:
         response_schema: type[BaseModel],
     ) -> LLMResponse:
         """Generate JSON with Anthropic and normalize the response."""
-        schema_json = json.dumps(response_schema.model_json_schema(), indent=2)
-        user_prompt = f"{prompt}\n\nReturn valid JSON matching this schema exactly:\n{schema_json}"
-
         try:
             response = self.client.messages.create(
-                model=self.model,
-                system=system,
-                max_tokens=4096,
-                messages=[{"role": "user", "content": user_prompt}],
+                **self._message_params(prompt, system, response_schema)
             )
         except Exception as exc:  # pragma: no cover - provider SDK behavior
-            raise LLMError(f"Anthropic API call failed: {exc}") from exc
+            raise LLMError(
+                f"Anthropic API call failed: {exc}", retry_after=retry_after_seconds(exc)
+            ) from exc
+
+        return _to_llm_response(response)
 
-        raw_text = _extract_anthropic_text(response.content)
+    def submit_batch(self, requests: list[BatchRequest]) -> str:
+        """Submit requests through the Message Batches API."""
+        try:
+            batch = self.client.messages.batches.create(
+                requests=[
+                    {
+                        "custom_id": request.custom_id,
+                        "params": self._message_params(
+                            request.prompt, request.system, request.response_schema
+                        ),
+                    }
+                    for request in requests
+                ]
+            )
+        except Exception as exc:  # pragma: no cover - provider SDK behavior
+            raise LLMError(f"Anthropic batch submit failed: {exc}") from exc
+        return batch.id
 
+    def poll_batch(self, batch_id: str) -> dict[str, LLMResponse] | None:
+        """Collect Message Batches results once processing has ended."""
         try:
-            parsed = json.loads(raw_text) if raw_text else {}
-        except Exception as exc:
-            raise LLMError(f"Anthropic response parsing failed: {exc}") from exc
-
-        usage = getattr(response, "usage", None)
-        input_tokens = int(getattr(usage, "input_tokens", 0) or 0) if usage else 0
-        output_tokens = int(getattr(usage, "output_tokens", 0) or 0) if usage else 0
-
-        return LLMResponse(
-            parsed=parsed,
-            raw_text=raw_text,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-        )
+            batch = self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status != "ended":
+                return None
+            entries = list(self.client.messages.batches.results(batch_id))
+        except Exception as exc:  # pragma: no cover - provider SDK behavior
+            raise LLMError(f"Anthropic batch poll failed: {exc}") from exc
+
+        results: dict[str, LLMResponse] = {}
+        for entry in entries:
+            if entry.result.type != "succeeded":
+                continue
+            try:
+                results[entry.custom_id] = _to_llm_response(entry.result.message)
+            except LLMError:
+                continue
+        return results
+
+    def cancel_batch(self, batch_id: str) -> None:
+        """Cancel a Message Batches job so unprocessed requests are not billed."""
+        try:
+            self.client.messages.batches.cancel(batch_id)
+        except Exception as exc:  # pragma: no cover - provider SDK behavior
+            raise LLMError(f"Anthropic batch cancel failed: {exc}") from exc
+
+    def _message_params(
+        self, prompt: str, system: str, response_schema: type[BaseModel]
+    ) -> dict[str, Any]:
+        """Build Messages API parameters, shared by live and batch requests."""
+        schema_json = _schema_prompt_text(response_schema)
+        user_prompt = f"{prompt}\n\nReturn valid JSON matching this schema exactly:\n{schema_json}"
+        return {
+            "model": self.model,
+            "system": system,
+            "max_tokens": 4096,
+            "messages": [{"role": "user", "content": user_prompt}],
+        }
+
+
+@lru_cache(maxsize=32)
+def _schema_prompt_text(response_schema: type[BaseModel]) -> str:
+    """Pretty-printed schema embedded in prompts, rendered once per model."""
+    return json.dumps(response_json_schema(response_schema), indent=2)
+
+
+def _to_llm_response(message: Any) -> LLMResponse:
+    """Normalize an Anthropic message into an LLMResponse."""
+    raw_text = _extract_anthropic_text(message.content)
+
+    try:
+        parsed = from_json(raw_text) if raw_text else {}
+    except Exception as exc:
+        raise LLMError(f"Anthropic response parsing failed: {exc}", retryable=False) from exc
+
+    usage = getattr(message, "usage", None)
+    input_tokens = int(getattr(usage, "input_tokens", 0) or 0) if usage else 0
+    output_tokens = int(getattr(usage, "output_tokens", 0) or 0) if usage else 0
+
+    return LLMResponse(
+        parsed=parsed,
+        raw_text=raw_text,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+    )
 
 
 def _extract_anthropic_text(blocks: Any) -> str:
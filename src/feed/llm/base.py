@@ -1,13 +1,63 @@
 """Provider-agnostic LLM interface and shared types."""
 
+import re
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import Any, Protocol
 
 from pydantic import BaseModel
 
+# Per-request timeout for provider calls, so a stalled request can't hold a
+# worker for the SDK's own (up to 10 minute) default
+DEFAULT_TIMEOUT_SECONDS = 120
+
+_RETRYABLE_PATTERNS = re.compile(
+    r"timed?\s*out|deadline exceeded|"
+    r"\b429\b|\brate.?limit|"
+    r"\b500\b|\b502\b|\b503\b|\b529\b|"
+    r"overloaded|unavailable",
+    re.IGNORECASE,
+)
+
 
 class LLMError(Exception):
-    """Raised when an LLM provider call fails."""
+    """Raised when an LLM provider call fails.
+
+    Raise sites that know whether a retry can help pass ``retryable``;
+    otherwise it is inferred once from the message. ``retry_after`` carries the
+    provider's Retry-After hint in seconds, when it sent one.
+    """
+
+    def __init__(
+        self,
+        *args: object,
+        retryable: bool | None = None,
+        retry_after: float | None = None,
+    ):
+        super().__init__(*args)
+        if retryable is not None:
+            self.retryable = retryable
+        self.retry_after = retry_after
+
+    @cached_property
+    def retryable(self) -> bool:
+        """Whether the failure looks transient (timeouts, rate limits, 5xx)."""
+        return bool(_RETRYABLE_PATTERNS.search(str(self)))
+
+
+def retry_after_seconds(exc: Exception) -> float | None:
+    """Retry-After delay from a provider SDK error's HTTP response, if any.
+
+    The Anthropic, OpenAI and Gemini SDK errors all expose the underlying
+    response as ``exc.response``; only the delta-seconds form is honored.
+    """
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(float(headers.get("retry-after", "")), 0.0)
+    except (TypeError, ValueError):
+        return None
 
 
 @dataclass
@@ -20,6 +70,16 @@ class LLMResponse:
     output_tokens: int
 
 
+@lru_cache(maxsize=32)
+def response_json_schema(response_schema: type[BaseModel]) -> dict[str, Any]:
+    """JSON schema for a response model, generated once per class.
+
+    Generation costs about a millisecond and the handful of response models
+    never change at runtime. The result is shared, so callers must not mutate it.
+    """
+    return response_schema.model_json_schema()
+
+
 class LLMClient(Protocol):
     """Protocol that all LLM providers must implement."""
 
@@ -31,3 +91,20 @@ class LLMClient(Protocol):
     ) -> LLMResponse:
         """Generate a structured JSON response."""
         ...
+
+
+@dataclass
+class BatchRequest:
+    """One prompt in a provider batch job, addressed by ``custom_id``.
+
+    Providers with an asynchronous batch API (roughly half price, results in
+    minutes to hours) implement ``submit_batch(requests) -> batch_id`` and
+    ``poll_batch(batch_id) -> dict[custom_id, LLMResponse] | None``, where
+    None means still running and failed items are omitted, plus
+    ``cancel_batch(batch_id)`` for jobs the caller stops waiting on.
+    """
+
+    custom_id: str
+    prompt: str
+    system: str
+    response_schema: type[BaseModel]
@@ -1,20 +1,20 @@
 """Google Gemini implementation of the LLM client interface."""
 
-import json
-
 from google import genai
 from google.genai import types
 from pydantic import BaseModel
+from pydantic_core import from_json
 
-from .base import LLMError, LLMResponse
+from .base import DEFAULT_TIMEOUT_SECONDS, LLMError, LLMResponse, retry_after_seconds
 
 
 class GeminiClient:
     """Google Gemini LLM provider."""
 
-    def __init__(self, api_key: str, model: str):
+    def __init__(self, api_key: str, model: str, timeout: float = DEFAULT_TIMEOUT_SECONDS):
         self.client = genai.Client(api_key=api_key)
         self.model = model
+        self.timeout = timeout
 
     def generate(
         self,
@@ -31,11 +31,13 @@ class GeminiClient:
                     system_instruction=system,
                     response_mime_type="application/json",
                     response_schema=response_schema,
-                    http_options=types.HttpOptions(timeout=120_000),
+                    http_options=types.HttpOptions(timeout=int(self.timeout * 1000)),
                 ),
             )
         except Exception as exc:  # pragma: no cover - provider SDK behavior
-            raise LLMError(f"Gemini API call failed: {exc}") from exc
+            raise LLMError(
+                f"Gemini API call failed: {exc}", retry_after=retry_after_seconds(exc)
+            ) from exc
 
         raw_text = getattr(response, "text", "") or ""
 
@@ -47,11 +49,11 @@ class GeminiClient:
                 else:
                     parsed = parsed_obj
             elif raw_text:
-                parsed = json.loads(raw_text)
+                parsed = from_json(raw_text)
             else:
                 parsed = {}
         except Exception as exc:
-            raise LLMError(f"Gemini response parsing failed: {exc}") from exc
+            raise LLMError(f"Gemini response parsing failed: {exc}", retryable=False) from exc
 
         usage = getattr(response, "usage_metadata", None)
         input_tokens = int(getattr(usage, "prompt_token_count", 0) or 0) if usage else 0
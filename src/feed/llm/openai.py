@@ -5,15 +5,26 @@ from typing import Any
 
 from openai import OpenAI
 from pydantic import BaseModel
+from pydantic_core import from_json
 
-from .base import LLMError, LLMResponse
+from .base import (
+    DEFAULT_TIMEOUT_SECONDS,
+    BatchRequest,
+    LLMError,
+    LLMResponse,
+    response_json_schema,
+    retry_after_seconds,
+)
+
+_BATCH_ENDPOINT = "/v1/chat/completions"
+_BATCH_PENDING_STATUSES = frozenset({"validating", "in_progress", "finalizing", "cancelling"})
 
 
 class OpenAIClient:
     """OpenAI LLM provider."""
 
-    def __init__(self, api_key: str, model: str):
-        self.client = OpenAI(api_key=api_key)
+    def __init__(self, api_key: str, model: str, timeout: float = DEFAULT_TIMEOUT_SECONDS):
+        self.client = OpenAI(api_key=api_key, timeout=timeout)
         self.model = model
 
     def generate(
@@ -25,40 +36,122 @@ class OpenAIClient:
         """Generate JSON with OpenAI and normalize the response."""
         try:
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system},
-                    {"role": "user", "content": prompt},
-                ],
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": response_schema.__name__,
-                        "schema": response_schema.model_json_schema(),
-                    },
-                },
+                **self._completion_body(prompt, system, response_schema)
             )
         except Exception as exc:  # pragma: no cover - provider SDK behavior
-            raise LLMError(f"OpenAI API call failed: {exc}") from exc
+            raise LLMError(
+                f"OpenAI API call failed: {exc}", retry_after=retry_after_seconds(exc)
+            ) from exc
 
         message = response.choices[0].message if response.choices else None
-        raw_text = _extract_openai_text(message)
+        usage = getattr(response, "usage", None)
+        return _to_llm_response(
+            raw_text=_extract_openai_text(message),
+            input_tokens=int(getattr(usage, "prompt_tokens", 0) or 0) if usage else 0,
+            output_tokens=int(getattr(usage, "completion_tokens", 0) or 0) if usage else 0,
+        )
 
+    def submit_batch(self, requests: list[BatchRequest]) -> str:
+        """Upload requests as a JSONL file and start a Batch API job."""
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": request.custom_id,
+                    "method": "POST",
+                    "url": _BATCH_ENDPOINT,
+                    "body": self._completion_body(
+                        request.prompt, request.system, request.response_schema
+                    ),
+                }
+            )
+            for request in requests
+        ]
         try:
-            parsed = json.loads(raw_text) if raw_text else {}
-        except Exception as exc:
-            raise LLMError(f"OpenAI response parsing failed: {exc}") from exc
+            batch_file = self.client.files.create(
+                file=("feed-batch.jsonl", "\n".join(lines).encode()),
+                purpose="batch",
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint=_BATCH_ENDPOINT,
+                completion_window="24h",
+            )
+        except Exception as exc:  # pragma: no cover - provider SDK behavior
+            raise LLMError(f"OpenAI batch submit failed: {exc}") from exc
+        return batch.id
 
-        usage = getattr(response, "usage", None)
-        input_tokens = int(getattr(usage, "prompt_tokens", 0) or 0) if usage else 0
-        output_tokens = int(getattr(usage, "completion_tokens", 0) or 0) if usage else 0
-
-        return LLMResponse(
-            parsed=parsed,
-            raw_text=raw_text,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-        )
+    def poll_batch(self, batch_id: str) -> dict[str, LLMResponse] | None:
+        """Download Batch API results once the job has reached a final state."""
+        try:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status in _BATCH_PENDING_STATUSES:
+                return None
+            if not batch.output_file_id:
+                return {}
+            output = self.client.files.content(batch.output_file_id).text
+        except Exception as exc:  # pragma: no cover - provider SDK behavior
+            raise LLMError(f"OpenAI batch poll failed: {exc}") from exc
+
+        results: dict[str, LLMResponse] = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            item = from_json(line)
+            body = (item.get("response") or {}).get("body") or {}
+            choices = body.get("choices") or []
+            if item.get("error") or not choices:
+                continue
+            usage = body.get("usage") or {}
+            try:
+                results[item["custom_id"]] = _to_llm_response(
+                    raw_text=_extract_openai_text(choices[0].get("message")),
+                    input_tokens=int(usage.get("prompt_tokens", 0) or 0),
+                    output_tokens=int(usage.get("completion_tokens", 0) or 0),
+                )
+            except LLMError:
+                continue
+        return results
+
+    def cancel_batch(self, batch_id: str) -> None:
+        """Cancel a Batch API job so unfinished requests are not billed."""
+        try:
+            self.client.batches.cancel(batch_id)
+        except Exception as exc:  # pragma: no cover - provider SDK behavior
+            raise LLMError(f"OpenAI batch cancel failed: {exc}") from exc
+
+    def _completion_body(
+        self, prompt: str, system: str, response_schema: type[BaseModel]
+    ) -> dict[str, Any]:
+        """Build a chat completion request body, shared by live and batch requests."""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt},
+            ],
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": response_schema.__name__,
+                    "schema": response_json_schema(response_schema),
+                },
+            },
+        }
+
+
+def _to_llm_response(raw_text: str, input_tokens: int, output_tokens: int) -> LLMResponse:
+    """Parse OpenAI message text into an LLMResponse."""
+    try:
+        parsed = from_json(raw_text) if raw_text else {}
+    except Exception as exc:
+        raise LLMError(f"OpenAI response parsing failed: {exc}", retryable=False) from exc
+
+    return LLMResponse(
+        parsed=parsed,
+        raw_text=raw_text,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+    )
 
 
 def _extract_openai_text(message: Any) -> str:
@@ -66,7 +159,10 @@ def _extract_openai_text(message: Any) -> str:
     if message is None:
         return ""
 
-    content = getattr(message, "content", "")
+    if isinstance(message, dict):
+        content = message.get("content", "")
+    else:
+        content = getattr(message, "content", "")
     if isinstance(content, str):
         return content
 
@@ -1,31 +1,35 @@
-"""LLM client wrapper with retry and exponential backoff."""
+"""LLM client wrapper with retry and jittered backoff."""
 
-import re
+import random
 import time
+from collections.abc import Callable
+from typing import TypeVar
 
 from pydantic import BaseModel
 
-from feed.llm.base import LLMError, LLMResponse
+from feed.llm.base import BatchRequest, LLMError, LLMResponse
 from feed.logging_config import get_logger
 
 logger = get_logger("llm.retry")
 
-_RETRYABLE_PATTERNS = re.compile(
-    r"timed?\s*out|deadline exceeded|"
-    r"\b429\b|\brate.?limit|"
-    r"\b500\b|\b502\b|\b503\b|\b529\b|"
-    r"overloaded|unavailable",
-    re.IGNORECASE,
-)
+T = TypeVar("T")
+
+# Upper bound on any retry sleep, computed backoff and provider Retry-After alike
+MAX_RETRY_DELAY = 60.0
 
 
 def _is_retryable(error: LLMError) -> bool:
     """Check if an LLM error is worth retrying."""
-    return bool(_RETRYABLE_PATTERNS.search(str(error)))
+    return error.retryable
 
 
 class RetryClient:
-    """Wraps an LLMClient with retry logic and exponential backoff."""
+    """
+    Wraps an LLMClient with retry logic and decorrelated-jitter backoff.
+
+    Each delay is drawn from [base_delay, 3 * previous delay], so concurrent
+    workers hitting the same rate limit spread out instead of retrying in lockstep.
+    """
 
     def __init__(
         self,
@@ -44,13 +48,42 @@ class RetryClient:
         response_schema: type[BaseModel],
     ) -> LLMResponse:
         """Generate with retry on transient failures."""
+        return self._with_retries(self.inner.generate, prompt, system, response_schema)
+
+    def _with_retries(self, call: Callable[..., T], *args: object) -> T:
+        """Run ``call(*args)``, retrying retryable LLMErrors with backoff."""
+        delay = self.base_delay
         for attempt in range(self.max_retries + 1):
             try:
-                return self.inner.generate(prompt, system, response_schema)
+                return call(*args)
             except LLMError as exc:
                 if not _is_retryable(exc) or attempt == self.max_retries:
                     raise
-                delay = self.base_delay * (2**attempt)
-                logger.warning(f"Retry {attempt + 1}/{self.max_retries} after {delay:.1f}s: {exc}")
-                time.sleep(delay)
+                delay = min(random.uniform(self.base_delay, delay * 3), MAX_RETRY_DELAY)
+                # A Retry-After hint replaces this sleep only; the jitter keeps its own state
+                sleep_for = delay if exc.retry_after is None else exc.retry_after
+                sleep_for = min(sleep_for, MAX_RETRY_DELAY)
+                logger.warning(
+                    f"Retry {attempt + 1}/{self.max_retries} after {sleep_for:.1f}s: {exc}"
+                )
+                time.sleep(sleep_for)
         raise LLMError("Unexpected: retry loop exited without return or raise")
+
+    @property
+    def supports_batch(self) -> bool:
+        """Whether the wrapped provider implements the batch API."""
+        return all(
+            hasattr(self.inner, name) for name in ("submit_batch", "poll_batch", "cancel_batch")
+        )
+
+    def submit_batch(self, requests: list[BatchRequest]) -> str:
+        """Submit a provider batch job (not retried: a duplicate job would double-bill)."""
+        return self.inner.submit_batch(requests)
+
+    def poll_batch(self, batch_id: str) -> dict[str, LLMResponse] | None:
+        """Poll a provider batch job, retrying transient failures (polling is idempotent)."""
+        return self._with_retries(self.inner.poll_batch, batch_id)
+
+    def cancel_batch(self, batch_id: str) -> None:
+        """Cancel a provider batch job that will no longer be waited on."""
+        self.inner.cancel_batch(batch_id)
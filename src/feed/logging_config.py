@@ -1,33 +1,57 @@
 """
 Logging configuration for the digest agent.
 
-Uses rich for beautiful terminal output.
+Uses rich for interactive terminal output and a plain stream otherwise.
 """
 
 import logging
+import sys
+from logging.handlers import MemoryHandler
 from typing import Literal
 
-from rich.console import Console
-from rich.logging import RichHandler
-
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
 
+def _build_handler(level: LogLevel) -> logging.Handler:
+    """
+    Rich output for interactive INFO+ sessions, a plain stream otherwise.
+
+    Rich lays out every record, which gets expensive at DEBUG volume and buys
+    nothing when stderr is redirected. At DEBUG the plain handler sits behind a
+    MemoryHandler so bursts of debug lines don't block on stderr writes;
+    warnings and above flush the buffer immediately. INFO runs write through
+    unbuffered, so cron, Docker and journald see progress as it happens and a
+    killed run keeps its last lines.
+    """
+    if level != "DEBUG" and sys.stderr.isatty():
+        # Deferred: every module imports get_logger, but only entry points need rich.
+        from rich.console import Console
+        from rich.logging import RichHandler
+
+        return RichHandler(
+            console=Console(stderr=True),
+            show_time=True,
+            show_path=False,
+            rich_tracebacks=True,
+            tracebacks_show_locals=True,
+        )
+
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s", "%H:%M:%S")
+    )
+    if level != "DEBUG":
+        return stream
+    return MemoryHandler(capacity=1000, flushLevel=logging.WARNING, target=stream)
+
+
 def setup_logging(level: LogLevel = "INFO") -> logging.Logger:
     """
-    Configure logging with rich handler.
+    Configure logging, with rich output for interactive terminals.
 
     Returns the root logger configured for the application.
     """
-    console = Console(stderr=True)
-
-    handler = RichHandler(
-        console=console,
-        show_time=True,
-        show_path=False,
-        rich_tracebacks=True,
-        tracebacks_show_locals=True,
-    )
+    handler = _build_handler(level)
 
     logging.basicConfig(
         level=level,
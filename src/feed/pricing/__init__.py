@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import NamedTuple
 
 from feed.logging_config import get_logger
@@ -20,12 +22,10 @@ class ModelPricing(NamedTuple):
     output_cost_per_mtok: float
 
 
-# model name/alias -> ModelPricing
-_REGISTRY: dict[str, ModelPricing] = {}
-
-
-def _load() -> None:
+def _load() -> tuple[dict[str, ModelPricing], dict[str, tuple[float, float]]]:
     """Load all JSON pricing files from the data directory."""
+    registry: dict[str, ModelPricing] = {}
+    per_token_rates: dict[str, tuple[float, float]] = {}
     for path in _DATA_DIR.glob("*.json"):
         data = json.loads(path.read_text())
         for model_name, info in data.get("models", {}).items():
@@ -33,12 +33,26 @@ def _load() -> None:
                 input_cost_per_mtok=info["inputCostPerMTok"],
                 output_cost_per_mtok=info["outputCostPerMTok"],
             )
-            _REGISTRY[model_name] = pricing
-            for alias in info.get("aliases", []):
-                _REGISTRY[alias] = pricing
+            per_token = (
+                pricing.input_cost_per_mtok / 1_000_000,
+                pricing.output_cost_per_mtok / 1_000_000,
+            )
+            for name in (model_name, *info.get("aliases", [])):
+                registry[name] = pricing
+                per_token_rates[name] = per_token
+    return registry, per_token_rates
+
+
+_registry, _per_token_rates = _load()
+
+# model name/alias -> ModelPricing, read-only once loaded
+_REGISTRY: Mapping[str, ModelPricing] = MappingProxyType(_registry)
 
+# model name/alias -> (input, output) USD per single token, folded at load time
+_PER_TOKEN: Mapping[str, tuple[float, float]] = MappingProxyType(_per_token_rates)
 
-_load()
+# Unknown models already warned about, so a run logs each one once
+_warned_missing: set[str] = set()
 
 
 def lookup(model: str) -> ModelPricing | None:
@@ -48,10 +62,11 @@ def lookup(model: str) -> ModelPricing | None:
 
 def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float | None:
     """Calculate USD cost for a model invocation. Returns None if model unknown."""
-    pricing = lookup(model)
-    if pricing is None:
-        logger.warning(f"No pricing data for model '{model}'")
+    rates = _PER_TOKEN.get(model)
+    if rates is None:
+        if model not in _warned_missing:
+            _warned_missing.add(model)
+            logger.warning(f"No pricing data for model '{model}'")
         return None
-    return (input_tokens / 1_000_000) * pricing.input_cost_per_mtok + (
-        output_tokens / 1_000_000
-    ) * pricing.output_cost_per_mtok
+    input_rate, output_rate = rates
+    return input_tokens * input_rate + output_tokens * output_rate
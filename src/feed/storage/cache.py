@@ -1,7 +1,6 @@
 """SQLite-backed response cache with TTL."""
 
 import hashlib
-import json
 import sqlite3
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -9,14 +8,16 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from pydantic_core import from_json, to_json
+
 from feed.logging_config import get_logger
 
 logger = get_logger("cache")
 
 
-def make_cache_key(article_id: str, model: str) -> str:
-    """Build a deterministic cache key from article ID and model name."""
-    raw = f"{article_id}:{model}"
+def make_cache_key(*parts: str) -> str:
+    """Build a deterministic SHA256 cache key from ordered string parts."""
+    raw = "\x1f".join(parts)
     return hashlib.sha256(raw.encode()).hexdigest()
 
 
@@ -67,14 +68,14 @@ class CacheStore:
             ).fetchone()
         if row is None:
             return None
-        return json.loads(row["value"])
+        return from_json(row["value"])
 
     def set(
         self,
         kind: str,
         key: str,
         value: dict[str, Any],
-        ttl_days: int | None = None,
+        ttl_days: float | None = None,
     ) -> None:
         """Store a value with TTL. Overwrites existing entries."""
         ttl = ttl_days if ttl_days is not None else self.default_ttl_days
@@ -83,7 +84,7 @@ class CacheStore:
             conn.execute(
                 """INSERT OR REPLACE INTO cache (kind, key, value, expires_at)
                    VALUES (?, ?, ?, ?)""",
-                (kind, key, json.dumps(value), expires_at.isoformat()),
+                (kind, key, to_json(value).decode(), expires_at.isoformat()),
             )
             # Lazy cleanup of expired rows
             conn.execute(
@@ -91,6 +92,15 @@ class CacheStore:
                 (datetime.now(UTC).isoformat(),),
             )
 
+    def purge_expired(self) -> int:
+        """Delete expired entries. Returns count deleted."""
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM cache WHERE expires_at <= ?",
+                (datetime.now(UTC).isoformat(),),
+            )
+            return cursor.rowcount
+
     def clear(self, kind: str | None = None) -> int:
         """Delete cached entries. Returns count deleted."""
         with self._connection() as conn:
@@ -1,17 +1,24 @@
 """Tests for the analysis module."""
 
-from datetime import UTC, datetime
+import threading
+import time
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import Mock
 
 import pytest
 
+import feed.analyze as analyze_module
+from feed.analyze import run_analysis
 from feed.analyze.digest_builder import DigestBuilder
-from feed.analyze.summarizer import Summarizer
-from feed.llm.base import LLMResponse
-from feed.models import Article
-from feed.storage.cache import CacheStore, make_cache_key
+from feed.analyze.summarizer import Summarizer, build_summary_prompt, summary_cache_key
+from feed.config import Settings
+from feed.llm.base import LLMError, LLMResponse
+from feed.models import Article, ArticleStatus
+from feed.storage.cache import CacheStore
+from feed.storage.db import Database
 
 
 @pytest.fixture
@@ -69,6 +76,176 @@ class TestSummarizer:
         assert result["success"] is False
         assert "API Error" in (result["error"] or "")
 
+    def test_summarize_batch_preserves_order_and_bounds_concurrency(
+        self, sample_article: Article
+    ) -> None:
+        """Batch results align with input order while in-flight calls stay capped."""
+        articles = [
+            sample_article.model_copy(update={"id": f"article-{i}", "title": f"Title {i}"})
+            for i in range(6)
+        ]
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def generate(prompt: str, system: str, response_schema: type) -> LLMResponse:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            title = prompt.split("Title: ", 1)[1].split("\n", 1)[0]
+            return LLMResponse(
+                parsed={"summary": title, "key_takeaways": [], "action_items": []},
+                raw_text="{}",
+                input_tokens=1,
+                output_tokens=1,
+            )
+
+        mock_client = Mock()
+        mock_client.generate.side_effect = generate
+        progress: list[int] = []
+
+        summarizer = Summarizer(client=mock_client)
+        results = summarizer.summarize_batch(
+            articles,
+            on_progress=lambda i, total, article: progress.append(i),
+            max_concurrency=2,
+        )
+
+        assert [r["article_id"] for r in results] == [a.id for a in articles]
+        assert [r["summary"] for r in results] == [a.title for a in articles]
+        assert peak <= 2
+        assert progress == list(range(6))
+
+    def test_iter_summaries_keeps_workers_busy_past_a_slow_request(
+        self, sample_article: Article
+    ) -> None:
+        """One stalled request doesn't hold back groups submitted after it."""
+        articles = [
+            sample_article.model_copy(update={"id": f"article-{i}", "title": f"Title {i}"})
+            for i in range(6)
+        ]
+        release = threading.Event()
+
+        def generate(prompt: str, system: str, response_schema: type) -> LLMResponse:
+            if "Title 0" in prompt:
+                assert release.wait(5)
+            return LLMResponse(
+                parsed={"summary": "ok", "key_takeaways": [], "action_items": []},
+                raw_text="{}",
+                input_tokens=1,
+                output_tokens=1,
+            )
+
+        mock_client = Mock()
+        mock_client.generate.side_effect = generate
+
+        stream = Summarizer(client=mock_client).iter_summaries(iter(articles), max_concurrency=2)
+        while_stalled = [next(stream)[0] for _ in range(5)]
+        release.set()
+
+        assert sorted(while_stalled) == [1, 2, 3, 4, 5]
+        assert [index for index, _, _ in stream] == [0]
+
+    def test_summarize_batch_groups_articles_into_one_request(
+        self, sample_article: Article
+    ) -> None:
+        """With batch_size > 1, several articles share one LLM call and split tokens."""
+        articles = [
+            sample_article.model_copy(update={"id": f"article-{i}", "title": f"Title {i}"})
+            for i in range(3)
+        ]
+        mock_client = Mock()
+        mock_client.generate.return_value = LLMResponse(
+            parsed={
+                "summaries": [
+                    {"summary": f"Summary {i}", "key_takeaways": [], "action_items": []}
+                    for i in range(3)
+                ]
+            },
+            raw_text="{}",
+            input_tokens=10,
+            output_tokens=6,
+        )
+
+        summarizer = Summarizer(client=mock_client)
+        results = summarizer.summarize_batch(articles, batch_size=3)
+
+        assert mock_client.generate.call_count == 1
+        prompt = mock_client.generate.call_args.kwargs["prompt"]
+        assert all(f'<article index="{i}">' in prompt for i in (1, 2, 3))
+        assert [r["summary"] for r in results] == ["Summary 0", "Summary 1", "Summary 2"]
+        assert sum(r["input_tokens"] for r in results) == 10
+        assert sum(r["output_tokens"] for r in results) == 6
+
+    def test_summarize_batch_falls_back_when_batch_response_malformed(
+        self, sample_article: Article
+    ) -> None:
+        """A batch response with the wrong entry count is retried per article."""
+        articles = [
+            sample_article.model_copy(update={"id": f"article-{i}", "title": f"Title {i}"})
+            for i in range(2)
+        ]
+        single = LLMResponse(
+            parsed={"summary": "Single", "key_takeaways": [], "action_items": []},
+            raw_text="{}",
+            input_tokens=1,
+            output_tokens=1,
+        )
+        malformed = LLMResponse(
+            parsed={"summaries": [{"summary": "Only one"}]},
+            raw_text="{}",
+            input_tokens=1,
+            output_tokens=1,
+        )
+        mock_client = Mock()
+        mock_client.generate.side_effect = [malformed, single, single]
+
+        summarizer = Summarizer(client=mock_client)
+        results = summarizer.summarize_batch(articles, batch_size=2)
+
+        assert mock_client.generate.call_count == 3
+        assert all(r["success"] and r["summary"] == "Single" for r in results)
+
+    def test_summarize_batch_retries_only_articles_the_response_skipped(
+        self, sample_article: Article
+    ) -> None:
+        """Indexed batch entries are matched by index; only missing articles are re-requested."""
+        articles = [
+            sample_article.model_copy(update={"id": f"article-{i}", "title": f"Title {i}"})
+            for i in range(3)
+        ]
+        partial = LLMResponse(
+            parsed={
+                "summaries": [
+                    {"index": i, "summary": f"Batched {i}", "key_takeaways": [], "action_items": []}
+                    for i in (3, 1)
+                ]
+            },
+            raw_text="{}",
+            input_tokens=10,
+            output_tokens=4,
+        )
+        single = LLMResponse(
+            parsed={"summary": "Single", "key_takeaways": [], "action_items": []},
+            raw_text="{}",
+            input_tokens=1,
+            output_tokens=1,
+        )
+        mock_client = Mock()
+        mock_client.generate.side_effect = [partial, single]
+
+        summarizer = Summarizer(client=mock_client)
+        results = summarizer.summarize_batch(articles, batch_size=3)
+
+        assert mock_client.generate.call_count == 2
+        assert "Title 1" in mock_client.generate.call_args.kwargs["prompt"]
+        assert [r["summary"] for r in results] == ["Batched 1", "Single", "Batched 3"]
+        assert sum(r["input_tokens"] for r in results) == 11
+
 
 class TestDigestBuilder:
     """Tests for the DigestBuilder class."""
@@ -114,6 +291,193 @@ class TestDigestBuilder:
         assert in_tok == 50
         assert out_tok == 25
 
+    def test_single_article_skips_all_llm_calls(self, sample_article: Article) -> None:
+        """A one-article run should echo the summary without any synthesis call."""
+        article = sample_article.model_copy(update={"summary": "Only summary"})
+        mock_client = Mock()
+
+        builder = DigestBuilder(client=mock_client)
+        digest, in_tok, out_tok = builder.build_digest([article])
+
+        mock_client.generate.assert_not_called()
+        assert digest.categories[0].synthesis == "Only summary"
+        assert (in_tok, out_tok) == (0, 0)
+
+    def test_category_syntheses_run_concurrently_in_sorted_order(
+        self, sample_article: Article
+    ) -> None:
+        """Category LLM calls should overlap while results stay sorted by name."""
+        articles = [
+            sample_article.model_copy(update={"id": f"{category}-{i}", "category": category})
+            for category in ("Zeta", "Alpha")
+            for i in range(2)
+        ]
+        barrier = threading.Barrier(2, timeout=5)
+
+        def generate(prompt: str, system: str, response_schema: type) -> LLMResponse:
+            if response_schema.__name__ == "CategorySynthesisResponse":
+                barrier.wait()  # deadlocks (and times out) if calls are sequential
+                name = prompt.split("today's ", 1)[1].split("\n", 1)[0]
+                parsed = {"synthesis": name, "top_takeaways": []}
+            else:
+                parsed = {"overall_themes": [], "must_read_overall": []}
+            return LLMResponse(parsed=parsed, raw_text="{}", input_tokens=1, output_tokens=1)
+
+        mock_client = Mock()
+        mock_client.generate.side_effect = generate
+
+        builder = DigestBuilder(
+            client=mock_client, max_concurrency=2, small_category_max_articles=0
+        )
+        digest, in_tok, _ = builder.build_digest(articles)
+
+        assert [c.name for c in digest.categories] == ["Alpha", "Zeta"]
+        assert [c.synthesis for c in digest.categories] == ["Alpha", "Zeta"]
+        assert in_tok == 3
+
+    def test_small_categories_share_one_synthesis_call(self, sample_article: Article) -> None:
+        """Several small categories should be synthesized in a single grouped request."""
+        articles = [
+            sample_article.model_copy(update={"id": f"{category}-{i}", "category": category})
+            for category in ("Alpha", "Beta")
+            for i in range(2)
+        ]
+
+        def generate(prompt: str, system: str, response_schema: type) -> LLMResponse:
+            if response_schema.__name__ == "MultiCategorySynthesisResponse":
+                assert '<category name="Alpha">' in prompt
+                assert '<category name="Beta">' in prompt
+                parsed = {
+                    "categories": [
+                        {"name": "Beta", "synthesis": "Beta synthesis", "top_takeaways": []},
+                        {"name": "Alpha", "synthesis": "Alpha synthesis", "top_takeaways": []},
+                    ]
+                }
+                return LLMResponse(parsed=parsed, raw_text="{}", input_tokens=9, output_tokens=4)
+            parsed = {"overall_themes": [], "must_read_overall": []}
+            return LLMResponse(parsed=parsed, raw_text="{}", input_tokens=1, output_tokens=1)
+
+        mock_client = Mock()
+        mock_client.generate.side_effect = generate
+
+        builder = DigestBuilder(client=mock_client)
+        digest, in_tok, out_tok = builder.build_digest(articles)
+
+        assert mock_client.generate.call_count == 2  # grouped + overall
+        assert [c.synthesis for c in digest.categories] == ["Alpha synthesis", "Beta synthesis"]
+        assert (in_tok, out_tok) == (10, 5)
+
+    def test_synthesis_cached_across_runs(self, sample_article: Article) -> None:
+        """Re-running on identical articles should serve every synthesis from cache."""
+        articles = [
+            sample_article.model_copy(update={"id": f"{category}-{i}", "category": category})
+            for category in ("Alpha", "Beta")
+            for i in range(5)
+        ]
+
+        def generate(prompt: str, system: str, response_schema: type) -> LLMResponse:
+            if response_schema.__name__ == "CategorySynthesisResponse":
+                parsed = {"synthesis": "Synth", "top_takeaways": []}
+            else:
+                parsed = {"overall_themes": ["Theme"], "must_read_overall": []}
+            return LLMResponse(parsed=parsed, raw_text="{}", input_tokens=5, output_tokens=5)
+
+        mock_client = Mock()
+        mock_client.generate.side_effect = generate
+
+        with TemporaryDirectory() as tmpdir:
+            cache = CacheStore(Path(tmpdir) / "test.db")
+            builder = DigestBuilder(client=mock_client, cache=cache, model_name="test-model")
+
+            builder.build_digest(articles)
+            calls_after_first = mock_client.generate.call_count
+            digest, in_tok, out_tok = builder.build_digest(articles)
+
+        assert calls_after_first == 3
+        assert mock_client.generate.call_count == 3
+        assert digest.overall_themes == ["Theme"]
+        assert (in_tok, out_tok) == (0, 0)
+
+    def test_batch_api_prefetches_category_synthesis(self, sample_article: Article) -> None:
+        """With use_batch_api, category syntheses come from the batch job, not live calls."""
+        articles = [
+            sample_article.model_copy(update={"id": f"tech-{i}", "summary": f"S{i}"})
+            for i in range(3)
+        ]
+        mock_client = Mock()
+        mock_client.supports_batch = True
+        mock_client.submit_batch.return_value = "batch-1"
+        mock_client.poll_batch.side_effect = [
+            None,
+            {
+                "cat-0": LLMResponse(
+                    parsed={"synthesis": "From batch", "top_takeaways": []},
+                    raw_text="{}",
+                    input_tokens=7,
+                    output_tokens=3,
+                )
+            },
+        ]
+        mock_client.generate.return_value = LLMResponse(
+            parsed={"overall_themes": [], "must_read_overall": []},
+            raw_text="{}",
+            input_tokens=1,
+            output_tokens=1,
+        )
+
+        builder = DigestBuilder(client=mock_client, use_batch_api=True, batch_poll_seconds=0)
+        digest, in_tok, _ = builder.build_digest(articles)
+
+        assert digest.categories[0].synthesis == "From batch"
+        assert mock_client.submit_batch.call_args.args[0][0].custom_id == "cat-0"
+        assert mock_client.poll_batch.call_count == 2
+        # Only the overall synthesis ran live.
+        assert mock_client.generate.call_count == 1
+        assert in_tok == 8
+
+    def test_batch_api_cancels_job_after_max_wait(self, sample_article: Article) -> None:
+        """A batch job still running at the deadline is cancelled and syntheses run live."""
+        articles = [
+            sample_article.model_copy(update={"id": f"tech-{i}", "summary": f"S{i}"})
+            for i in range(3)
+        ]
+        mock_client = Mock()
+        mock_client.supports_batch = True
+        mock_client.submit_batch.return_value = "batch-1"
+        mock_client.poll_batch.return_value = None
+        mock_client.generate.return_value = LLMResponse(
+            parsed={"synthesis": "Live", "top_takeaways": [], "overall_themes": []},
+            raw_text="{}",
+            input_tokens=1,
+            output_tokens=1,
+        )
+
+        builder = DigestBuilder(
+            client=mock_client, use_batch_api=True, batch_poll_seconds=0, batch_max_wait_seconds=0
+        )
+        digest, _, _ = builder.build_digest(articles)
+
+        mock_client.cancel_batch.assert_called_once_with("batch-1")
+        assert digest.categories[0].synthesis == "Live"
+
+    def test_near_duplicate_detection(self) -> None:
+        """High token overlap or identical normalized text should count as duplicate."""
+        existing = ["Inference costs keep falling fast.", "  Totally   different topic  "]
+
+        assert DigestBuilder._is_near_duplicate("inference costs keep falling", existing)
+        assert DigestBuilder._is_near_duplicate("totally different TOPIC", existing)
+        assert not DigestBuilder._is_near_duplicate("Hiring markets are tightening.", existing)
+        assert DigestBuilder._is_near_duplicate("   ", existing)
+
+    def test_near_duplicate_detects_short_restatement_of_long_text(self) -> None:
+        """A short claim contained in a much longer one is still a duplicate."""
+        existing = [
+            "Across every vendor we tracked this quarter, inference costs keep falling "
+            "while training budgets rise and procurement cycles stretch out further."
+        ]
+
+        assert DigestBuilder._is_near_duplicate("Inference costs keep falling", existing)
+
     def test_category_insight_included_when_gate_passes(self, sample_article: Article) -> None:
         """Category insight should be included when confidence and sources pass gates."""
         second_article = Article(
@@ -362,7 +726,7 @@ class TestSummarizerCache:
         """Cached summaries should be returned without calling LLM."""
         mock_client = Mock()
         model_name = "gemini-3-flash-preview"
-        key = make_cache_key(sample_article.id, model_name)
+        key = summary_cache_key(model_name, build_summary_prompt(sample_article))
         cached_data = {
             "success": True,
             "article_id": sample_article.id,
@@ -396,7 +760,7 @@ class TestSummarizerCache:
             output_tokens=50,
         )
         model_name = "gemini-3-flash-preview"
-        key = make_cache_key(sample_article.id, model_name)
+        key = summary_cache_key(model_name, build_summary_prompt(sample_article))
 
         summarizer = Summarizer(client=mock_client)
         result = summarizer.summarize_article(sample_article, cache=cache, model_name=model_name)
@@ -409,6 +773,46 @@ class TestSummarizerCache:
         assert cached is not None
         assert cached["summary"] == "fresh summary"
 
+    def test_cache_hit_for_identical_content_under_new_id(
+        self, sample_article: Article, cache
+    ) -> None:
+        """Keys are content-addressed, so a re-ingested copy reuses the summary."""
+        mock_client = Mock()
+        mock_client.generate.return_value = LLMResponse(
+            parsed={"summary": "shared summary", "key_takeaways": [], "action_items": []},
+            raw_text="{}",
+            input_tokens=100,
+            output_tokens=50,
+        )
+        model_name = "gemini-3-flash-preview"
+        summarizer = Summarizer(client=mock_client)
+        summarizer.summarize_article(sample_article, cache=cache, model_name=model_name)
+
+        copy = sample_article.model_copy(update={"id": "other-article-id"})
+        result = summarizer.summarize_article(copy, cache=cache, model_name=model_name)
+
+        assert result["summary"] == "shared summary"
+        assert result["article_id"] == "other-article-id"
+        mock_client.generate.assert_called_once()
+
+    def test_cache_miss_when_content_changes(self, sample_article: Article, cache) -> None:
+        """Edited content should not reuse a stale summary."""
+        mock_client = Mock()
+        mock_client.generate.return_value = LLMResponse(
+            parsed={"summary": "s", "key_takeaways": [], "action_items": []},
+            raw_text="{}",
+            input_tokens=1,
+            output_tokens=1,
+        )
+        model_name = "gemini-3-flash-preview"
+        summarizer = Summarizer(client=mock_client)
+        summarizer.summarize_article(sample_article, cache=cache, model_name=model_name)
+
+        edited = sample_article.model_copy(update={"content": "Rewritten body."})
+        summarizer.summarize_article(edited, cache=cache, model_name=model_name)
+
+        assert mock_client.generate.call_count == 2
+
     def test_no_cache_still_works(self, sample_article: Article) -> None:
         """Summarizer should work without a cache (backward compatible)."""
         mock_client = Mock()
@@ -428,3 +832,115 @@ class TestSummarizerCache:
 
         assert result["success"] is True
         assert result["summary"] == "normal summary"
+
+
+SUMMARY_RESPONSE = LLMResponse(
+    parsed={"summary": "Summary", "key_takeaways": [], "action_items": []},
+    raw_text="{}",
+    input_tokens=1,
+    output_tokens=1,
+)
+
+
+class TestRunAnalysis:
+    """Tests for the summarize-and-store loop in run_analysis."""
+
+    @pytest.fixture
+    def db(self, tmp_path: Path) -> Database:
+        return Database(tmp_path / "articles.db")
+
+    @staticmethod
+    def _articles(sample_article: Article, count: int) -> list[Article]:
+        return [
+            sample_article.model_copy(
+                update={
+                    "id": f"a{i:04d}",
+                    "url": f"https://example.com/a{i:04d}",
+                    "title": f"Article {i:04d}",
+                }
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _run(monkeypatch: pytest.MonkeyPatch, db: Database, client: Mock, **settings):
+        monkeypatch.setattr(
+            analyze_module,
+            "get_settings",
+            lambda: Settings.model_construct(
+                llm_api_key="AIza-test",
+                resend_api_key="re_test",
+                email_from="from@example.com",
+                email_to="to@example.com",
+                **settings,
+            ),
+        )
+        monkeypatch.setattr(analyze_module, "get_client", lambda **_: client)
+        builder = Mock()
+        builder.return_value.build_digest.return_value = (Mock(), 0, 0)
+        monkeypatch.setattr(analyze_module, "DigestBuilder", builder)
+        return run_analysis(db=db, no_cache=True), builder.return_value.build_digest
+
+    def test_progress_logs_first_last_and_every_twentieth(
+        self,
+        sample_article: Article,
+        db: Database,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Per-article progress is throttled to the first, last and every total//20-th."""
+        db.save_articles_bulk(self._articles(sample_article, 100))
+        client = Mock()
+        client.generate.return_value = SUMMARY_RESPONSE
+        # Freeze the clock so the once-a-second fallback never fires.
+        monkeypatch.setattr(time, "monotonic", lambda: 0.0)
+
+        with caplog.at_level("INFO", logger="feed"):
+            result, _ = self._run(monkeypatch, db, client, llm_concurrency=1)
+
+        progress = [r.message for r in caplog.records if r.message.startswith("[")]
+        assert result.articles_analyzed == 100
+        assert [line.split("]")[0] for line in progress] == [
+            "[1/100",
+            *(f"[{position}/100" for position in range(5, 101, 5)),
+        ]
+        assert not [r for r in caplog.records if "Summarizing" in r.message]
+
+    def test_streams_results_into_windowed_commits(
+        self, sample_article: Article, db: Database, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Results commit one concurrency window at a time; failures are marked FAILED."""
+        db.save_articles_bulk(self._articles(sample_article, 7))
+
+        def generate(prompt: str, system: str, response_schema: type) -> LLMResponse:
+            if "Article 0003" in prompt:
+                raise LLMError("401 Unauthorized")
+            return SUMMARY_RESPONSE
+
+        client = Mock()
+        client.generate.side_effect = generate
+        commits: list[int] = []
+        transaction = db.transaction
+
+        @contextmanager
+        def counting_transaction():
+            with transaction() as conn:
+                yield conn
+            commits.append(1)
+
+        monkeypatch.setattr(db, "transaction", counting_transaction)
+
+        result, build_digest = self._run(
+            monkeypatch, db, client, llm_concurrency=2, llm_batch_size=1
+        )
+
+        since = datetime.now(UTC) - timedelta(days=1)
+        failed = db.get_articles_since(since, status=ArticleStatus.FAILED)
+        summarized = build_digest.call_args.args[0]
+        assert len(commits) == 4
+        assert [article.id for article in failed] == ["a0003"]
+        assert result.articles_analyzed == 6
+        assert len(result.errors) == 1
+        assert len(db.get_articles_since(since, status=ArticleStatus.SUMMARIZED)) == 6
+        assert all(article.content == "" for article in summarized)
+        assert all(article.summary == "Summary" for article in summarized)
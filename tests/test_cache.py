@@ -24,6 +24,9 @@ class TestMakeCacheKey:
         k2 = make_cache_key("article-1", "gpt-4o-mini")
         assert k1 != k2
 
+    def test_part_boundaries_are_significant(self):
+        assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+
     def test_key_is_hex_string(self):
         key = make_cache_key("article-1", "gemini-flash")
         assert len(key) == 64  # SHA256 hex digest
@@ -97,6 +100,18 @@ class TestCacheStore:
         assert stats["total_entries"] == 2
         assert stats["expired_entries"] == 0
 
+    def test_purge_expired_removes_only_expired(self, cache):
+        cache.set("summary", "new", {"b": 2})
+        with cache._connection() as conn:
+            conn.execute(
+                "INSERT INTO cache (kind, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                ("summary", "old", "{}", "2000-01-01T00:00:00+00:00"),
+            )
+
+        assert cache.purge_expired() == 1
+        assert cache.purge_expired() == 0
+        assert cache.get("summary", "new") == {"b": 2}
+
     def test_lazy_cleanup_removes_expired_on_set(self, cache):
         """Expired entries are cleaned up lazily on the next set() call."""
         cache.set("summary", "k1", {"a": 1}, ttl_days=-1)  # already expired
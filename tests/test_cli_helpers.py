@@ -1,5 +1,6 @@
 """Tests for CLI helper behavior."""
 
+import logging
 from datetime import UTC, datetime
 from types import SimpleNamespace
 
@@ -125,3 +126,22 @@ def test_print_digest_text_uses_renderer(capsys) -> None:
     out = capsys.readouterr().out
     assert "CLI Article" in out
     assert "CLI helpers remain predictable." in out
+
+
+def test_log_handler_uses_rich_only_for_interactive_info(monkeypatch) -> None:
+    """DEBUG runs get the buffered plain handler; redirected INFO runs write through."""
+    from logging.handlers import MemoryHandler
+
+    from rich.logging import RichHandler
+
+    import feed.logging_config as logging_config
+
+    monkeypatch.setattr(logging_config.sys.stderr, "isatty", lambda: True, raising=False)
+    assert isinstance(logging_config._build_handler("INFO"), RichHandler)
+    assert isinstance(logging_config._build_handler("DEBUG"), MemoryHandler)
+
+    monkeypatch.setattr(logging_config.sys.stderr, "isatty", lambda: False, raising=False)
+    handler = logging_config._build_handler("INFO")
+    assert isinstance(handler, logging.StreamHandler)
+    assert not isinstance(handler, MemoryHandler)
+    assert isinstance(logging_config._build_handler("DEBUG"), MemoryHandler)
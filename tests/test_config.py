@@ -3,7 +3,7 @@
 import pytest
 
 from feed import config
-from feed.config import FeedConfig, Settings
+from feed.config import FeedConfig, Settings, validate_settings
 
 
 def test_settings_supports_legacy_google_api_key_alias(monkeypatch) -> None:
@@ -44,7 +44,7 @@ def test_get_settings_singleton_uses_new_fields(monkeypatch) -> None:
     monkeypatch.setenv("EMAIL_FROM", "from@example.com")
     monkeypatch.setenv("EMAIL_TO", "to@example.com")
 
-    config._settings = None
+    config.get_settings.cache_clear()
     settings = config.get_settings()
 
     assert settings.llm_provider == "gemini"
@@ -139,3 +139,56 @@ def test_settings_retry_custom_values(monkeypatch) -> None:
     assert settings.insights_mode == "always"
     assert settings.insight_min_confidence == 5
     assert settings.max_insights_per_digest == 3
+
+
+def _valid_settings(monkeypatch, tmp_path) -> Settings:
+    monkeypatch.setenv("LLM_PROVIDER", "gemini")
+    monkeypatch.setenv("LLM_API_KEY", "AIza-test-key")
+    monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
+    monkeypatch.setenv("EMAIL_FROM", "from@example.com")
+    monkeypatch.setenv("EMAIL_TO", "to@example.com")
+    monkeypatch.setenv("CONFIG_DIR", str(tmp_path / "config"))
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
+    settings = Settings()
+    (settings.config_dir / "feeds.yaml").write_text("feeds: {}\n")
+    return settings
+
+
+def test_validate_settings_passes_for_well_formed_config(monkeypatch, tmp_path) -> None:
+    """Well-formed keys and a readable feeds.yaml should produce no issues."""
+    settings = _valid_settings(monkeypatch, tmp_path)
+
+    assert validate_settings(settings) == []
+
+
+def test_validate_settings_flags_malformed_keys(monkeypatch, tmp_path) -> None:
+    """Keys with the wrong prefix or embedded whitespace should be reported."""
+    settings = _valid_settings(monkeypatch, tmp_path).model_copy(
+        update={"llm_api_key": "sk-openai-key-for-gemini", "resend_api_key": "re_ key"}
+    )
+
+    issues = validate_settings(settings)
+
+    assert any("should start with 'AIza'" in issue for issue in issues)
+    assert any("Resend API key contains whitespace" in issue for issue in issues)
+
+
+def test_validate_settings_flags_binary_feeds_file(monkeypatch, tmp_path) -> None:
+    """A feeds.yaml containing NUL bytes should be rejected without parsing it."""
+    settings = _valid_settings(monkeypatch, tmp_path)
+    (settings.config_dir / "feeds.yaml").write_bytes(b"feeds:\x00\x01")
+
+    issues = validate_settings(settings)
+
+    assert len(issues) == 1
+    assert "binary" in issues[0]
+
+
+def test_validate_settings_can_skip_feeds_and_email(monkeypatch, tmp_path) -> None:
+    """Callers that only need the LLM should not fail on feeds/email problems."""
+    settings = _valid_settings(monkeypatch, tmp_path)
+    (settings.config_dir / "feeds.yaml").unlink()
+    settings = settings.model_copy(update={"resend_api_key": "bad"})
+
+    assert validate_settings(settings, feeds=False, email=False) == []
+    assert len(validate_settings(settings)) == 2
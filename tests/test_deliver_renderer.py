@@ -1,8 +1,12 @@
 """Tests for email template rendering."""
 
+import os
+import stat
 from datetime import UTC, datetime
 
-from feed.deliver.renderer import EmailRenderer
+import pytest
+
+from feed.deliver.renderer import EmailRenderer, _bytecode_cache, get_renderer
 from feed.models import Article, CategoryDigest, DailyDigest, NonObviousInsight
 
 
@@ -57,33 +61,74 @@ def make_sample_digest() -> DailyDigest:
     )
 
 
-def test_render_html_includes_dark_mode_meta_tags() -> None:
-    renderer = EmailRenderer()
-    html = renderer.render_html(make_sample_digest(), "Digest Subject")
+@pytest.fixture(scope="module")
+def sample_digest() -> DailyDigest:
+    """One digest for the whole module; rendering never mutates it."""
+    return make_sample_digest()
+
+
+@pytest.fixture(scope="module")
+def rendered_html(sample_digest: DailyDigest) -> str:
+    """HTML rendered once and shared by the read-only assertions below."""
+    return EmailRenderer().render_html(sample_digest, "Digest Subject")
+
+
+def test_render_html_includes_dark_mode_meta_tags(rendered_html: str) -> None:
+    html = rendered_html
 
     assert '<meta name="color-scheme" content="dark light" />' in html
     assert '<meta name="supported-color-schemes" content="dark light" />' in html
 
 
-def test_render_html_uses_dark_theme_palette() -> None:
-    renderer = EmailRenderer()
-    html = renderer.render_html(make_sample_digest(), "Digest Subject")
+DARK_PALETTE = (
+    "background-color: #020617",
+    "background-color: #111827",
+    "background-color: #332701",
+    "color: #f8fafc",
+    "color: #94a3b8",
+)
 
-    assert "background-color: #020617" in html
-    assert "background-color: #111827" in html
-    assert "background-color: #332701" in html
-    assert "color: #f8fafc" in html
-    assert "color: #94a3b8" in html
 
+def test_render_html_uses_dark_theme_palette(rendered_html: str) -> None:
+    missing = [style for style in DARK_PALETTE if style not in rendered_html]
 
-def test_render_outputs_non_obvious_insight_blocks() -> None:
-    renderer = EmailRenderer()
-    digest = make_sample_digest()
+    assert not missing, missing
 
-    html = renderer.render_html(digest, "Digest Subject")
-    text = renderer.render_text(digest)
+
+def test_render_outputs_non_obvious_insight_blocks(
+    rendered_html: str, sample_digest: DailyDigest
+) -> None:
+    html = rendered_html
+    text = EmailRenderer().render_text(sample_digest)
 
     assert "Non-Obvious Insights" in html
     assert "Non-Obvious Insight" in html
     assert "NON-OBVIOUS INSIGHTS" in text
     assert "NON-OBVIOUS INSIGHT:" in text
+
+
+def test_get_renderer_is_shared(sample_digest: DailyDigest) -> None:
+    renderer = get_renderer()
+
+    assert renderer is get_renderer()
+    html, text = renderer.render(sample_digest)
+    assert "Non-Obvious Insights" in html
+    assert "NON-OBVIOUS INSIGHTS" in text
+
+
+def test_render_formats_header_date_once_for_both_bodies(sample_digest: DailyDigest) -> None:
+    heading = sample_digest.date.strftime("%A, %B %d, %Y")
+
+    html, text = EmailRenderer().render(sample_digest)
+
+    assert heading in html
+    assert text.splitlines()[1] == heading
+
+
+def test_bytecode_cache_dir_is_private_to_the_current_user() -> None:
+    cache = _bytecode_cache()
+
+    assert cache is not None
+    info = os.stat(cache.directory)
+    assert info.st_uid == os.getuid()
+    assert stat.S_IMODE(info.st_mode) == 0o700
@@ -3,6 +3,8 @@
 from datetime import UTC, datetime
 from types import SimpleNamespace
 
+import httpx
+
 from feed.deliver.email import EmailSender
 from feed.models import Article, CategoryDigest, DailyDigest
 
@@ -120,3 +122,42 @@ def test_send_digest_returns_failure_when_resend_raises(monkeypatch) -> None:
     assert result.success is False
     assert result.email_id is None
     assert result.error == "resend unavailable"
+
+
+def test_sender_reuses_one_keep_alive_transport(monkeypatch) -> None:
+    """Senders should install a single pooled transport for the Resend SDK."""
+    import feed.deliver.email as email_module
+
+    monkeypatch.setattr(
+        email_module,
+        "get_settings",
+        lambda: SimpleNamespace(
+            resend_api_key="settings-key",
+            email_from="from@example.com",
+            email_to="default@example.com",
+        ),
+    )
+    monkeypatch.setattr(email_module.resend, "default_http_client", None)
+
+    EmailSender()
+    transport = email_module.resend.default_http_client
+    EmailSender()
+
+    assert email_module.resend.default_http_client is transport
+
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"id": "email-789"})
+
+    client = email_module._KeepAliveHTTPClient()
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    content, status, _ = client.request(
+        "post", "https://api.resend.com/emails", headers={}, json={"to": ["a@example.com"]}
+    )
+
+    assert status == 200
+    assert b"email-789" in content
+    assert seen[0].method == "POST"
+    assert b"a@example.com" in seen[0].content
@@ -14,6 +14,7 @@ from feed.ingest.feeds import (
     _parse_entry_date,
     fetch_all_feeds,
     fetch_feed,
+    iter_feed_results,
 )
 
 
@@ -125,6 +126,39 @@ def test_fetch_feed_returns_articles_within_lookback(mock_get):
     assert result.feed_name == "My Feed"
 
 
+@patch("feed.ingest.feeds.httpx.get")
+def test_fetch_feed_keeps_raw_content_encoded_for_later_extraction(mock_get):
+    recent = datetime.now(UTC) - timedelta(hours=1)
+    pub_str = recent.strftime("%a, %d %b %Y %H:%M:%S +0000")
+    rss = f"""<?xml version="1.0"?>
+    <rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+      <channel>
+        <title>Full Text</title>
+        <item>
+          <title>Long read</title>
+          <link>https://example.com/long</link>
+          <pubDate>{pub_str}</pubDate>
+          <description>Teaser only</description>
+          <content:encoded><![CDATA[<p>First paragraph.</p><p>Second one.</p>]]></content:encoded>
+        </item>
+      </channel>
+    </rss>
+    """.strip().encode()
+
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.url = "https://example.com/feed"
+    resp.headers = {"content-type": "application/rss+xml"}
+    resp.content = rss
+    mock_get.return_value = resp
+
+    result = fetch_feed(feed_url="https://example.com/feed", feed_name="Full", lookback_hours=48)
+
+    article = result.articles[0]
+    assert result.entry_html == {article.id: "<p>First paragraph.</p><p>Second one.</p>"}
+    assert (article.content, article.word_count) == ("", 0)
+
+
 @patch("feed.ingest.feeds.httpx.get")
 def test_fetch_feed_filters_old_articles(mock_get):
     old = datetime.now(UTC) - timedelta(days=30)
@@ -219,3 +253,29 @@ def test_fetch_all_feeds_captures_top_level_exception(mock_fetch):
     assert len(results) == 1
     assert results[0].success is False
     assert "inner-boom" in (results[0].error or "")
+
+
+@patch("feed.ingest.feeds.fetch_feed")
+def test_iter_feed_results_shares_one_client(mock_fetch):
+    """Every feed fetch in a run should reuse the same keep-alive client."""
+    cfg = {name: {"url": f"https://example.com/{name}"} for name in ("a", "b", "c")}
+    mock_fetch.return_value = MagicMock(success=True)
+
+    results = list(iter_feed_results(cfg, lookback_hours=24, max_articles_per_feed=5))
+
+    clients = {id(call.kwargs["client"]) for call in mock_fetch.call_args_list}
+    assert len(results) == 3
+    assert len(clients) == 1
+
+
+def test_pooled_client_uses_http2_only_when_h2_is_installed(monkeypatch):
+    """HTTP/2 should be requested only when httpx can actually negotiate it."""
+    import feed.ingest.http as http_module
+
+    created = MagicMock()
+    monkeypatch.setattr(http_module.httpx, "Client", created)
+
+    for available in (False, True):
+        monkeypatch.setattr(http_module, "HTTP2_AVAILABLE", available)
+        http_module.pooled_client(max_connections=4, max_keepalive_connections=2)
+        assert created.call_args.kwargs["http2"] is available
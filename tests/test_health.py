@@ -0,0 +1,61 @@
+"""Tests for deep healthcheck probes."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import Mock
+
+import httpx
+
+from feed.health import check_llm, check_resend, run_deep_checks
+from feed.storage.cache import CacheStore
+
+
+def _client(handler) -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_check_llm_uses_provider_auth_header() -> None:
+    """Anthropic probes should send x-api-key to the models endpoint."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"data": []})
+
+    assert check_llm(_client(handler), "anthropic", "sk-ant-test") is None
+    assert seen[0].url.path == "/v1/models"
+    assert seen[0].headers["x-api-key"] == "sk-ant-test"
+
+
+def test_check_llm_reports_http_error() -> None:
+    """A rejected key should surface the status code."""
+    client = _client(lambda request: httpx.Response(401))
+
+    assert check_llm(client, "openai", "sk-bad") == "LLM API check failed (openai): HTTP 401"
+
+
+def test_check_resend_accepts_restricted_send_only_key() -> None:
+    """Send-only Resend keys can't list domains but are still valid."""
+    client = _client(lambda request: httpx.Response(401, json={"name": "restricted_api_key"}))
+
+    assert check_resend(client, "re_test") is None
+
+
+def test_run_deep_checks_caches_result() -> None:
+    """A second run within the TTL should not hit the network."""
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={})
+
+    settings = Mock(llm_provider="gemini", llm_api_key="AIza-test", resend_api_key="re_test")
+    with TemporaryDirectory() as tmpdir:
+        cache = CacheStore(Path(tmpdir) / "test.db")
+        client = _client(handler)
+
+        assert run_deep_checks(settings, cache=cache, client=client) == []
+        assert run_deep_checks(settings, cache=cache, client=client) == []
+
+    assert calls == 2
@@ -1,18 +1,23 @@
 """Tests for the ingestion module."""
 
 import concurrent.futures
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
-from feed.ingest.feeds import fetch_feed, generate_article_id
+from feed.ingest import run_ingestion
+from feed.ingest.feeds import FeedResult, fetch_feed, generate_article_id
 from feed.ingest.parser import clean_text, extract_text_content
-from feed.models import Article
+from feed.models import Article, ArticleStatus
 from feed.storage.db import Database
 
+# Publication time for articles whose timestamp doesn't matter to the test
+PUBLISHED = datetime(2026, 1, 1, tzinfo=UTC)
+
 
 class TestArticleId:
     """Tests for article ID generation."""
@@ -56,12 +61,61 @@ class TestDatabase:
             title="Test Article",
             feed_name="Test Feed",
             feed_url="https://example.com/feed",
-            published=datetime.now(UTC),
+            published=PUBLISHED,
         )
 
         assert db.save_article(article) is True
         assert db.article_exists("test123")
 
+    def test_point_queries_see_later_commits_and_open_transaction(self, db):
+        """Reader-backed lookups must not serve a stale snapshot or miss in-transaction rows."""
+
+        def article(article_id: str) -> Article:
+            return Article(
+                id=article_id,
+                url=f"https://example.com/{article_id}",
+                title=article_id,
+                feed_name="Test Feed",
+                feed_url="https://example.com/feed",
+                published=PUBLISHED,
+            )
+
+        assert not db.article_exists("first")
+        db.save_article(article("first"))
+        assert db.article_exists("first")
+        assert db.count_articles_since(PUBLISHED) == 1
+
+        with db.transaction():
+            db.save_article(article("second"))
+            assert db.article_exists("second")
+            assert db.count_articles_since(PUBLISHED) == 2
+
+    def test_long_content_is_stored_compressed(self, db):
+        """Long bodies round-trip through a compressed column; short ones stay text."""
+        import sqlite3
+
+        long_body = "Plenty of prose about deployment pipelines. " * 200
+        articles = [
+            Article(
+                id=article_id,
+                url=f"https://example.com/{article_id}",
+                title=article_id,
+                feed_name="Test Feed",
+                feed_url="https://example.com/feed",
+                published=PUBLISHED,
+                content=content,
+            )
+            for article_id, content in (("long", long_body), ("short", "A short note."))
+        ]
+        db.save_articles_bulk(articles)
+
+        stored = {a.id: a.content for a in db.get_pending_articles()}
+        assert stored == {"long": long_body, "short": "A short note."}
+
+        with sqlite3.connect(db.db_path) as conn:
+            kinds = dict(conn.execute("SELECT id, typeof(content) FROM articles"))
+        assert kinds == {"long": "blob", "short": "text"}
+
     def test_save_duplicate_returns_false(self, db):
         """Saving duplicate should return False."""
         article = Article(
@@ -70,12 +124,138 @@ class TestDatabase:
             title="Test Article",
             feed_name="Test Feed",
             feed_url="https://example.com/feed",
-            published=datetime.now(UTC),
+            published=PUBLISHED,
         )
 
         assert db.save_article(article) is True
         assert db.save_article(article) is False
 
+    def test_max_article_ts(self, db):
+        """max_article_ts should be None when empty and set after a save."""
+        assert db.max_article_ts() is None
+
+        db.save_article(
+            Article(
+                id="test123",
+                url="https://example.com/test",
+                title="Test Article",
+                feed_name="Test Feed",
+                feed_url="https://example.com/feed",
+                published=PUBLISHED,
+            )
+        )
+
+        latest = db.max_article_ts()
+        assert latest is not None
+        assert latest.tzinfo is UTC
+        assert abs((datetime.now(UTC) - latest).total_seconds()) < 60
+
+    def test_max_article_ts_uses_created_at_index(self, db):
+        """MAX(created_at) should be served by the index, not a table scan."""
+        with db._connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT MAX(created_at) FROM articles"
+            ).fetchall()
+
+        assert any("idx_articles_created_at" in row[-1] for row in plan)
+
+    def test_connections_use_wal_and_normal_sync(self, db):
+        """Every connection should run in WAL with synchronous=NORMAL and a busy timeout."""
+        with db._connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    def test_shared_returns_same_instance_per_path(self, db):
+        """shared() should memoize one instance per resolved path."""
+        first = Database.shared(db.db_path)
+        second = Database.shared(db.db_path.parent / "." / db.db_path.name)
+
+        assert first is second
+
+    def test_iter_articles_since_streams_in_chunks(self, db):
+        """iter_articles_since should match count and yield every row across chunks."""
+        now = datetime.now(UTC)
+        for i in range(5):
+            db.save_article(
+                Article(
+                    id=f"stream{i}",
+                    url=f"https://example.com/{i}",
+                    title=f"Article {i}",
+                    feed_name="Test Feed",
+                    feed_url="https://example.com/feed",
+                    published=now,
+                )
+            )
+        since = now - timedelta(hours=1)
+
+        streamed = list(db.iter_articles_since(since, ArticleStatus.PENDING, chunk=2))
+
+        assert db.count_articles_since(since, ArticleStatus.PENDING) == 5
+        assert sorted(a.id for a in streamed) == [f"stream{i}" for i in range(5)]
+
+    def test_transaction_commits_once_and_rolls_back_on_error(self, db):
+        """Writes inside transaction() are atomic: all commit or none do."""
+        article = Article(
+            id="tx1",
+            url="https://example.com/tx1",
+            title="Tx Article",
+            feed_name="Test Feed",
+            feed_url="https://example.com/feed",
+            published=PUBLISHED,
+        )
+        db.save_article(article)
+
+        with pytest.raises(RuntimeError), db.transaction():
+            db.update_article_status("tx1", ArticleStatus.FAILED)
+            raise RuntimeError("boom")
+        assert db.get_pending_articles()[0].id == "tx1"
+
+        with db.transaction():
+            db.update_article_summary("tx1", "Summary", ["a"], [])
+        assert db.get_pending_articles() == []
+
+    def test_save_articles_bulk_counts_only_new(self, db):
+        """Bulk save inserts in one go and ignores already-stored articles."""
+        articles = [
+            Article(
+                id=f"bulk{i}",
+                url=f"https://example.com/bulk{i}",
+                title=f"Bulk {i}",
+                feed_name="Test Feed",
+                feed_url="https://example.com/feed",
+                published=PUBLISHED,
+            )
+            for i in range(3)
+        ]
+        db.save_article(articles[0])
+
+        assert db.save_articles_bulk(articles) == 2
+        assert {a.id for a in db.get_pending_articles()} == {"bulk0", "bulk1", "bulk2"}
+        assert db.save_articles_bulk([]) == 0
+
+    def test_filter_new_ids_returns_unstored(self, db):
+        """Only ids missing from the articles table come back."""
+        db.save_articles_bulk(
+            Article(
+                id=f"known{i}",
+                url=f"https://example.com/known{i}",
+                title=f"Known {i}",
+                feed_name="Test Feed",
+                feed_url="https://example.com/feed",
+                published=PUBLISHED,
+            )
+            for i in (0, 1500)
+        )
+        ids = [f"known{i}" for i in range(2000)]
+
+        assert db.filter_new_ids(ids) == set(ids) - {"known0", "known1500"}
+        assert db.filter_new_ids([]) == set()
+        with db.transaction():
+            # Reusing the transaction's connection must not trip over the temp table
+            assert db.filter_new_ids(["known0", "fresh"]) == {"fresh"}
+            assert db.filter_new_ids(["fresh"]) == {"fresh"}
+
 
 class TestTextCleaning:
     """Tests for text cleaning."""
@@ -137,7 +317,7 @@ class TestAtomicSave:
             title="Test",
             feed_name="Feed",
             feed_url="https://example.com/feed",
-            published=datetime.now(UTC),
+            published=PUBLISHED,
         )
 
     def test_concurrent_duplicate_saves(self, db):
@@ -286,3 +466,87 @@ class TestFeedStatusTimestamp:
         ts = row[0]
         # datetime.now(timezone.utc).isoformat() includes +00:00
         assert "+00:00" in ts
+
+
+class TestRunIngestion:
+    """Tests for the streaming ingestion pipeline."""
+
+    @staticmethod
+    def _article(article_id: str) -> Article:
+        return Article(
+            id=article_id,
+            url=f"https://example.com/{article_id}",
+            title=f"Article {article_id}",
+            feed_name="Test Feed",
+            feed_url="https://example.com/feed",
+            published=PUBLISHED,
+        )
+
+    def test_dedups_fetches_and_stores_as_feeds_arrive(self, tmp_path):
+        """New articles are fetched and stored once; stored, repeated, and thin ones skipped."""
+        db = Database(tmp_path / "test.db")
+        db.save_article(self._article("old"))
+        feed_results = [
+            FeedResult(
+                "https://a.example/feed", "A", [self._article("old"), self._article("new1")], True
+            ),
+            FeedResult("https://b.example/feed", "B", [], False, error="HTTP 500"),
+            FeedResult(
+                "https://c.example/feed", "C", [self._article("new1"), self._article("thin")], True
+            ),
+        ]
+        fetched: list[str] = []
+
+        def fake_fetch(article, client=None, **_):
+            fetched.append(article.id)
+            article.word_count = 5 if article.id == "thin" else 100
+            return article
+
+        settings = SimpleNamespace(lookback_hours=24, max_articles_per_feed=5, extract_processes=1)
+        feed_config = SimpleNamespace(feeds={"A": {}, "B": {}, "C": {}})
+        with (
+            patch("feed.ingest.get_settings", return_value=settings),
+            patch("feed.ingest.iter_feed_results", return_value=iter(feed_results)),
+            patch("feed.ingest.parser.fetch_article_content", side_effect=fake_fetch),
+        ):
+            result = run_ingestion(db=db, feed_config=feed_config)
+
+        assert sorted(fetched) == ["new1", "thin"]
+        assert (result.feeds_successful, result.feeds_failed) == (2, 1)
+        assert (result.articles_found, result.articles_new, result.articles_processed) == (4, 2, 1)
+        assert db.filter_new_ids(["new1", "thin"]) == {"thin"}
+        with db._connection() as conn:
+            failures = conn.execute(
+                "SELECT consecutive_failures FROM feed_status WHERE feed_name = 'B'"
+            ).fetchone()[0]
+        assert failures == 1
+
+    def test_extracts_feed_full_text_only_for_new_articles(self, tmp_path):
+        """Entry HTML of already-stored articles is never parsed; new full text skips the fetch."""
+        db = Database(tmp_path / "test.db")
+        db.save_article(self._article("old"))
+        body = "<p>" + " ".join(["word"] * 60) + "</p>"
+        feed_results = [
+            FeedResult(
+                "https://a.example/feed",
+                "A",
+                [self._article("old"), self._article("full")],
+                True,
+                entry_html={"old": body, "full": body},
+            )
+        ]
+        settings = SimpleNamespace(lookback_hours=24, max_articles_per_feed=5, extract_processes=1)
+        feed_config = SimpleNamespace(feeds={"A": {}})
+        with (
+            patch("feed.ingest.get_settings", return_value=settings),
+            patch("feed.ingest.iter_feed_results", return_value=iter(feed_results)),
+            patch("feed.ingest.parser.fetch_article_content") as fetch,
+            patch("feed.ingest.parser.extract_text_content", wraps=extract_text_content) as extract,
+        ):
+            result = run_ingestion(db=db, feed_config=feed_config)
+
+        fetch.assert_not_called()
+        assert extract.call_count == 1
+        assert result.articles_processed == 1
+        stored = db.get_articles_since(PUBLISHED - timedelta(days=1))
+        assert {article.id: article.word_count for article in stored} == {"old": 0, "full": 60}
@@ -4,14 +4,16 @@ from types import ModuleType
 
 import pytest
 
-from feed.llm import LLMError, create_client
+from feed.llm import LLMError, create_client, get_client
+from feed.llm.base import response_json_schema
 from feed.llm.retry import RetryClient
 
 
 class _DummyClient:
-    def __init__(self, api_key: str, model: str):
+    def __init__(self, api_key: str, model: str, timeout: float):
         self.api_key = api_key
         self.model = model
+        self.timeout = timeout
 
 
 def test_create_client_openai_uses_provider_default(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -76,3 +78,40 @@ def test_create_client_passes_retry_config(monkeypatch: pytest.MonkeyPatch) -> N
 
     assert isinstance(client, RetryClient)
     assert client.max_retries == 5
+
+
+def test_create_client_passes_timeout_to_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Factory should bound provider requests with the configured timeout."""
+    module = ModuleType("feed.llm.anthropic")
+    module.AnthropicClient = _DummyClient
+    monkeypatch.setitem(__import__("sys").modules, "feed.llm.anthropic", module)
+
+    assert create_client(provider="anthropic", api_key="test-key").inner.timeout == 120
+    client = create_client(provider="anthropic", api_key="test-key", timeout=30.0)
+
+    assert client.inner.timeout == 30.0
+
+
+def test_get_client_reuses_instance_per_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """get_client should hand back one client per (provider, key, model, retries)."""
+    module = ModuleType("feed.llm.openai")
+    module.OpenAIClient = _DummyClient
+    monkeypatch.setitem(__import__("sys").modules, "feed.llm.openai", module)
+    get_client.cache_clear()
+
+    first = get_client("openai", "test-key")
+    again = get_client("openai", "test-key")
+    other = get_client("openai", "other-key")
+    get_client.cache_clear()
+
+    assert first is again
+    assert first is not other
+
+
+def test_response_json_schema_is_generated_once_per_model() -> None:
+    from feed.analyze.summarizer import ArticleSummaryResponse
+
+    schema = response_json_schema(ArticleSummaryResponse)
+
+    assert schema is response_json_schema(ArticleSummaryResponse)
+    assert schema == ArticleSummaryResponse.model_json_schema()
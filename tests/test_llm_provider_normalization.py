@@ -33,7 +33,7 @@ def test_openai_client_generates_json_and_usage(monkeypatch) -> None:
             )
 
     class FakeOpenAI:
-        def __init__(self, api_key: str) -> None:
+        def __init__(self, api_key: str, timeout: float) -> None:
             self.api_key = api_key
             self.chat = SimpleNamespace(completions=FakeCompletions())
 
@@ -78,7 +78,7 @@ def test_openai_client_wraps_invalid_json(monkeypatch) -> None:
     openai_module = ModuleType("openai")
 
     class FakeOpenAI:
-        def __init__(self, api_key: str) -> None:
+        def __init__(self, api_key: str, timeout: float) -> None:
             self.chat = SimpleNamespace(
                 completions=SimpleNamespace(
                     create=lambda **_kwargs: SimpleNamespace(
@@ -115,7 +115,7 @@ def test_anthropic_client_generates_json_and_usage(monkeypatch) -> None:
             )
 
     class FakeAnthropic:
-        def __init__(self, api_key: str) -> None:
+        def __init__(self, api_key: str, timeout: float) -> None:
             self.api_key = api_key
             self.messages = FakeMessages()
 
@@ -152,3 +152,33 @@ def test_anthropic_text_extraction_accepts_objects_and_empty_blocks(monkeypatch)
 
     assert module._extract_anthropic_text(blocks) == "first\nsecond"
     assert module._extract_anthropic_text([]) == ""
+
+
+def test_openai_batch_results_parsed_and_failures_skipped(monkeypatch) -> None:
+    """Batch output lines should map custom_id to responses, skipping errored items."""
+    openai_module = ModuleType("openai")
+    output = "\n".join(
+        [
+            '{"custom_id": "cat-0", "error": null, "response": {"body": {'
+            '"choices": [{"message": {"content": "{\\"answer\\": \\"batched\\"}"}}],'
+            '"usage": {"prompt_tokens": 3, "completion_tokens": 2}}}}',
+            '{"custom_id": "cat-1", "error": {"message": "boom"}, "response": null}',
+        ]
+    )
+
+    class FakeOpenAI:
+        def __init__(self, api_key: str, timeout: float) -> None:
+            self.batches = SimpleNamespace(
+                retrieve=lambda _id: SimpleNamespace(status="completed", output_file_id="f-1")
+            )
+            self.files = SimpleNamespace(content=lambda _id: SimpleNamespace(text=output))
+
+    openai_module.OpenAI = FakeOpenAI
+    monkeypatch.setitem(sys.modules, "openai", openai_module)
+    module = _fresh_import("feed.llm.openai")
+
+    results = module.OpenAIClient(api_key="key", model="model").poll_batch("batch-1")
+
+    assert list(results) == ["cat-0"]
+    assert results["cat-0"].parsed == {"answer": "batched"}
+    assert results["cat-0"].input_tokens == 3
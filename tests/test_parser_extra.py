@@ -8,8 +8,10 @@ from unittest.mock import MagicMock, patch
 import httpx
 
 from feed.ingest.parser import (
+    ContentFetcher,
     clean_text,
     extract_text_content,
+    fetch_all_content,
     fetch_article_content,
     process_articles,
 )
@@ -44,6 +46,11 @@ def test_clean_text_removes_unsubscribe_and_view_in_browser():
     assert "View in browser" not in cleaned
 
 
+def test_clean_text_collapses_gaps_left_by_artifacts():
+    text = "Intro.\n\nShare this post\n\nLeave a comment\n\nBody text. Unsubscribe  now"
+    assert clean_text(text) == "Intro.\n\nBody text. now"
+
+
 def test_extract_text_content_prefers_substack_body_markup():
     html = """
     <html><body>
@@ -70,6 +77,53 @@ def test_extract_text_content_falls_back_to_body_when_no_known_container():
     assert "Just a paragraph" in content
 
 
+def test_extract_text_content_substack_body_wins_over_other_blocks():
+    html = """
+    <html><body>
+      <div class="comments"><p>Reader comment</p></div>
+      <div class="available-content"><div class="body markup"><p>Post body</p></div></div>
+    </body></html>
+    """
+    content = extract_text_content(html)
+    assert content == "Post body"
+
+
+def test_extract_text_content_handles_xml_declaration_and_empty_input():
+    html = "<?xml version='1.0' encoding='utf-8'?><html><body><p>XHTML para</p></body></html>"
+    assert extract_text_content(html) == "XHTML para"
+    assert extract_text_content("   ") == ""
+
+
+def test_extract_text_content_decodes_bytes_by_header_meta_or_utf8():
+    """Undecoded bodies should honor the HTTP charset, then <meta>, then default to UTF-8."""
+    body = "<html><body><p>Caf\u00e9 cr\u00e8me</p></body></html>"
+    meta = "<html><head><meta charset='iso-8859-1'></head><body><p>Caf\u00e9</p></body></html>"
+
+    assert (
+        extract_text_content(body.encode("latin-1"), encoding="latin-1") == "Caf\u00e9 cr\u00e8me"
+    )
+    assert extract_text_content(meta.encode("latin-1")) == "Caf\u00e9"
+    assert extract_text_content(body.encode("utf-8")) == "Caf\u00e9 cr\u00e8me"
+    assert extract_text_content(body.encode("utf-8"), encoding="no-such-codec") != ""
+    # Header labels libxml2 knows by a different name than Python's codec
+    japanese = "<html><body><p>\u65e5\u672c\u8a9e\u306e\u6587\u7ae0</p></body></html>"
+    assert (
+        extract_text_content(japanese.encode("euc-jp"), encoding="EUC-JP")
+        == "\u65e5\u672c\u8a9e\u306e\u6587\u7ae0"
+    )
+    korean = "<html><body><p>\ud55c\uad6d\uc5b4</p></body></html>"
+    assert extract_text_content(korean.encode("euc-kr"), encoding="euc_kr") == "\ud55c\uad6d\uc5b4"
+
+
+def test_extract_text_content_stops_at_word_budget(monkeypatch):
+    import feed.ingest.parser as parser_module
+
+    monkeypatch.setattr(parser_module, "MAX_EXTRACT_WORDS", 10)
+    html = "<html><body>" + "<p>one two three four</p>" * 50 + "</body></html>"
+
+    assert len(extract_text_content(html).split()) == 12
+
+
 def test_extract_text_content_picks_wordpress_entry_content():
     html = """
     <html><body>
@@ -88,9 +142,10 @@ def test_extract_text_content_finds_main():
 @patch("feed.ingest.parser.httpx.get")
 def test_fetch_article_content_populates_word_count(mock_get):
     mock_response = MagicMock()
-    mock_response.text = (
-        "<html><body><article><p>" + " ".join(["word"] * 60) + "</p></article></body></html>"
+    mock_response.content = (
+        b"<html><body><article><p>" + b" ".join([b"word"] * 60) + b"</p></article></body></html>"
     )
+    mock_response.charset_encoding = None
     mock_response.raise_for_status = MagicMock()
     mock_get.return_value = mock_response
 
@@ -122,7 +177,7 @@ def test_fetch_article_content_returns_article_on_unknown_error(mock_get):
 
 @patch("feed.ingest.parser.fetch_article_content")
 def test_process_articles_drops_low_word_count(mock_fetch):
-    def _short(article):
+    def _short(article, **_):
         article.content = "tiny"
         article.word_count = 5
         return article
@@ -135,6 +190,80 @@ def test_process_articles_drops_low_word_count(mock_fetch):
     assert processed == []
 
 
+@patch("feed.ingest.parser.fetch_article_content")
+def test_fetch_all_content_shares_client_and_keeps_order(mock_fetch):
+    clients = set()
+
+    def _fetch(article, client=None, **_):
+        clients.add(id(client))
+        article.word_count = 100
+        return article
+
+    mock_fetch.side_effect = _fetch
+    articles = [_article(f"https://host{i % 3}.example.com/{i}") for i in range(10)]
+
+    fetched = fetch_all_content(articles, max_concurrency=4)
+
+    assert [str(a.url) for a in fetched] == [str(a.url) for a in articles]
+    assert len(clients) == 1
+    assert fetch_all_content([]) == []
+
+
+@patch("feed.ingest.parser.fetch_article_content")
+def test_fetch_all_content_skips_articles_with_feed_text(mock_fetch):
+    full = _article("https://example.com/full")
+    full.content = " ".join(["w"] * 80)
+    full.word_count = 80
+
+    assert fetch_all_content([full]) == [full]
+    mock_fetch.assert_not_called()
+
+
+def test_fetch_all_content_stops_fetching_from_blocked_hosts(monkeypatch):
+    import feed.ingest.parser as parser_module
+
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        if request.url.host == "paywall.example.com":
+            return httpx.Response(403)
+        return httpx.Response(200, html="<p>" + " ".join(["word"] * 60) + "</p>")
+
+    monkeypatch.setattr(
+        parser_module,
+        "pooled_client",
+        lambda **_: httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    articles = [_article(f"https://paywall.example.com/{i}") for i in range(3)]
+    articles.append(_article("https://open.example.com/post"))
+
+    fetched = fetch_all_content(articles, max_concurrency=1)
+
+    assert [a.word_count for a in fetched] == [0, 0, 0, 60]
+    assert requested == ["https://paywall.example.com/0", "https://open.example.com/post"]
+
+
+def test_fetch_article_content_extracts_on_process_pool():
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    body = b"<html><body><article><p>" + b" ".join([b"word"] * 60) + b"</p></article></body></html>"
+    client = httpx.Client(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, content=body))
+    )
+
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        article = fetch_article_content(_article(), client=client, extract_pool=pool)
+
+    assert article.word_count == 60
+
+
+def test_content_fetcher_extracts_inline_unless_processes_configured():
+    with ContentFetcher(max_concurrency=1) as fetcher:
+        assert fetcher._extract_pool is None
+
+
 def test_process_articles_keeps_articles_above_threshold():
     # Pre-populate word_count so we don't need network fetch
     a = _article()
@@ -22,3 +22,28 @@ def test_estimate_cost_uses_per_million_token_rates() -> None:
 def test_estimate_cost_returns_none_for_unknown_model() -> None:
     """Unknown models should not produce a misleading cost estimate."""
     assert pricing.estimate_cost("unknown-model", input_tokens=100, output_tokens=100) is None
+
+
+def test_estimate_cost_matches_for_aliases() -> None:
+    """Aliases should share the precomputed per-token rates of their canonical model."""
+    canonical = pricing.estimate_cost("claude-opus-4-5-20251101", 1_000, 2_000)
+
+    assert canonical == pricing.estimate_cost("claude-opus-4-5", 1_000, 2_000)
+    assert canonical == 0.055
+
+
+def test_provider_default_models_have_pricing() -> None:
+    """Every provider's default model should produce a real cost, not None."""
+    from feed.llm import PROVIDER_DEFAULTS
+
+    for model in PROVIDER_DEFAULTS.values():
+        assert pricing.estimate_cost(model, input_tokens=1, output_tokens=1) is not None
+
+
+def test_unknown_model_warns_once(caplog) -> None:
+    """Repeated estimates for the same unknown model should log a single warning."""
+    with caplog.at_level("WARNING", logger="feed.pricing"):
+        for _ in range(3):
+            assert pricing.estimate_cost("made-up-model-for-warn-test", 10, 10) is None
+
+    assert len([r for r in caplog.records if "made-up-model-for-warn-test" in r.message]) == 1
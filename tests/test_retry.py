@@ -1,23 +1,28 @@
 """Tests for LLM retry logic."""
 
+import random
 import time
+from unittest.mock import Mock
 
+import httpx
 import pytest
 
-from feed.llm.base import LLMError, LLMResponse
-from feed.llm.retry import RetryClient, _is_retryable
+from feed.llm.base import LLMError, LLMResponse, retry_after_seconds
+from feed.llm.retry import MAX_RETRY_DELAY, RetryClient, _is_retryable
 
 
 class FakeClient:
-    """Fake LLM client that can be configured to fail."""
+    """Fake LLM client that replays a fixed script of responses and errors."""
+
+    __slots__ = ("call_count", "responses")
 
     def __init__(self, responses: list):
-        self.responses = list(responses)
+        self.responses = tuple(responses)
         self.call_count = 0
 
     def generate(self, prompt, system, response_schema):
+        result = self.responses[self.call_count]
         self.call_count += 1
-        result = self.responses.pop(0)
         if isinstance(result, Exception):
             raise result
         return result
@@ -30,105 +35,122 @@ OK_RESPONSE = LLMResponse(
     output_tokens=5,
 )
 
+# Reused across scripted responses; re-raising an instance is fine in tests
+TIMEOUT_ERROR = LLMError("request timed out")
+AUTH_ERROR = LLMError("401 Unauthorized")
 
-class TestIsRetryable:
-    def test_timeout_is_retryable(self):
-        assert _is_retryable(LLMError("request timed out")) is True
-
-    def test_deadline_exceeded_is_retryable(self):
-        assert _is_retryable(LLMError("deadline exceeded")) is True
-
-    def test_rate_limit_429_is_retryable(self):
-        assert _is_retryable(LLMError("429 Too Many Requests")) is True
-
-    def test_server_error_500_is_retryable(self):
-        assert _is_retryable(LLMError("500 Internal Server Error")) is True
-
-    def test_server_error_503_is_retryable(self):
-        assert _is_retryable(LLMError("503 Service Unavailable")) is True
-
-    def test_overloaded_529_is_retryable(self):
-        assert _is_retryable(LLMError("529 overloaded")) is True
-
-    def test_auth_error_not_retryable(self):
-        assert _is_retryable(LLMError("401 Unauthorized")) is False
 
-    def test_parse_error_not_retryable(self):
-        assert _is_retryable(LLMError("response parsing failed")) is False
-
-    def test_unknown_error_not_retryable(self):
-        assert _is_retryable(LLMError("something unexpected")) is False
+class TestIsRetryable:
+    @pytest.mark.parametrize(
+        ("message", "expected"),
+        [
+            ("request timed out", True),
+            ("deadline exceeded", True),
+            ("429 Too Many Requests", True),
+            ("500 Internal Server Error", True),
+            ("503 Service Unavailable", True),
+            ("529 overloaded", True),
+            ("401 Unauthorized", False),
+            ("response parsing failed", False),
+            ("something unexpected", False),
+        ],
+    )
+    def test_retryable_is_inferred_from_message(self, message, expected):
+        assert _is_retryable(LLMError(message)) is expected
+
+    def test_explicit_flag_overrides_message(self):
+        assert _is_retryable(LLMError("500 but unparseable", retryable=False)) is False
+        assert _is_retryable(LLMError("connection reset", retryable=True)) is True
 
 
 class TestRetryClient:
-    def test_success_no_retry(self):
-        inner = FakeClient([OK_RESPONSE])
-        client = RetryClient(inner, max_retries=2, base_delay=0.01)
+    @pytest.fixture(autouse=True)
+    def sleeps(self, monkeypatch) -> list[float]:
+        """Record backoff delays instead of sleeping through them."""
+        recorded: list[float] = []
+        monkeypatch.setattr(time, "sleep", recorded.append)
+        return recorded
+
+    @pytest.mark.parametrize(
+        ("responses", "max_retries", "error_match", "expected_calls"),
+        [
+            pytest.param([OK_RESPONSE], 2, None, 1, id="success-no-retry"),
+            pytest.param([TIMEOUT_ERROR, OK_RESPONSE], 2, None, 2, id="retry-then-succeed"),
+            pytest.param([TIMEOUT_ERROR] * 3, 2, "timed out", 3, id="retries-exhausted"),
+            pytest.param([AUTH_ERROR], 2, "401", 1, id="non-retryable"),
+            pytest.param([TIMEOUT_ERROR], 0, "timed out", 1, id="zero-retries"),
+        ],
+    )
+    def test_attempts(self, responses, max_retries, error_match, expected_calls):
+        inner = FakeClient(responses)
+        client = RetryClient(inner, max_retries=max_retries, base_delay=0.01)
+
+        if error_match is None:
+            assert client.generate("prompt", "system", object).parsed == {"summary": "ok"}
+        else:
+            with pytest.raises(LLMError, match=error_match):
+                client.generate("prompt", "system", object)
+
+        assert inner.call_count == expected_calls
+
+    def test_backoff_is_jittered_within_decorrelated_bounds(self, sleeps):
+        inner = FakeClient([TIMEOUT_ERROR] * 4 + [OK_RESPONSE])
+        client = RetryClient(inner, max_retries=4, base_delay=1.0)
 
-        result = client.generate("prompt", "system", object)
-
-        assert result.parsed == {"summary": "ok"}
-        assert inner.call_count == 1
+        client.generate("prompt", "system", object)
 
-    def test_retries_on_retryable_error_then_succeeds(self):
-        inner = FakeClient(
-            [
-                LLMError("request timed out"),
-                OK_RESPONSE,
-            ]
-        )
-        client = RetryClient(inner, max_retries=2, base_delay=0.01)
+        assert len(sleeps) == 4
+        previous = 1.0
+        for delay in sleeps:
+            assert 1.0 <= delay <= previous * 3
+            previous = delay
 
-        result = client.generate("prompt", "system", object)
+    @pytest.mark.parametrize("base_delay", [25.0, 90.0])
+    def test_backoff_never_exceeds_cap(self, sleeps, monkeypatch, base_delay):
+        monkeypatch.setattr(random, "uniform", lambda low, high: max(low, high))
+        inner = FakeClient([TIMEOUT_ERROR] * 3 + [OK_RESPONSE])
+        client = RetryClient(inner, max_retries=3, base_delay=base_delay)
 
-        assert result.parsed == {"summary": "ok"}
-        assert inner.call_count == 2
+        client.generate("prompt", "system", object)
 
-    def test_raises_after_max_retries_exhausted(self):
-        inner = FakeClient(
-            [
-                LLMError("request timed out"),
-                LLMError("request timed out"),
-                LLMError("request timed out"),
-            ]
-        )
-        client = RetryClient(inner, max_retries=2, base_delay=0.01)
+        assert sleeps == [min(base_delay * 3, MAX_RETRY_DELAY)] + [MAX_RETRY_DELAY] * 2
 
-        with pytest.raises(LLMError, match="timed out"):
-            client.generate("prompt", "system", object)
+    def test_retry_after_hint_overrides_backoff(self, sleeps):
+        inner = FakeClient([LLMError("429 Too Many Requests", retry_after=7.5), OK_RESPONSE])
+        client = RetryClient(inner, max_retries=2, base_delay=1.0)
 
-        assert inner.call_count == 3
+        client.generate("prompt", "system", object)
 
-    def test_non_retryable_error_fails_immediately(self):
-        inner = FakeClient([LLMError("401 Unauthorized")])
-        client = RetryClient(inner, max_retries=2, base_delay=0.01)
+        assert sleeps == [7.5]
 
-        with pytest.raises(LLMError, match="401"):
-            client.generate("prompt", "system", object)
+    def test_retry_after_hint_is_capped_and_does_not_seed_backoff(self, sleeps, monkeypatch):
+        monkeypatch.setattr(random, "uniform", lambda low, high: max(low, high))
+        oversized = LLMError("429 Too Many Requests", retry_after=86_400.0)
+        inner = FakeClient([oversized, TIMEOUT_ERROR, OK_RESPONSE])
+        client = RetryClient(inner, max_retries=2, base_delay=1.0)
 
-        assert inner.call_count == 1
+        client.generate("prompt", "system", object)
 
-    def test_zero_retries_means_no_retry(self):
-        inner = FakeClient([LLMError("request timed out")])
-        client = RetryClient(inner, max_retries=0, base_delay=0.01)
+        assert sleeps == [MAX_RETRY_DELAY, 9.0]
 
-        with pytest.raises(LLMError, match="timed out"):
-            client.generate("prompt", "system", object)
+    def test_poll_batch_retries_transient_errors(self, sleeps):
+        inner = Mock()
+        inner.poll_batch.side_effect = [TIMEOUT_ERROR, {"cat-0": OK_RESPONSE}]
+        client = RetryClient(inner, max_retries=2, base_delay=1.0)
 
-        assert inner.call_count == 1
+        assert client.poll_batch("batch-1") == {"cat-0": OK_RESPONSE}
+        assert inner.poll_batch.call_count == 2
+        assert len(sleeps) == 1
 
-    def test_backoff_delay_increases(self):
-        inner = FakeClient(
-            [
-                LLMError("request timed out"),
-                LLMError("request timed out"),
-                OK_RESPONSE,
-            ]
-        )
-        client = RetryClient(inner, max_retries=2, base_delay=0.05)
 
-        start = time.monotonic()
-        client.generate("prompt", "system", object)
-        elapsed = time.monotonic() - start
+class TestRetryAfterSeconds:
+    def test_reads_delta_seconds_from_response_headers(self):
+        exc = Exception("rate limited")
+        exc.response = httpx.Response(429, headers={"Retry-After": "12"})
+        assert retry_after_seconds(exc) == 12.0
 
-        assert elapsed >= 0.12
+    def test_ignores_missing_or_http_date_values(self):
+        assert retry_after_seconds(Exception("no response")) is None
+        exc = Exception("rate limited")
+        exc.response = httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})
+        assert retry_after_seconds(exc) is None